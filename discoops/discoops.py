@@ -6,22 +6,108 @@ from redbot.core import commands, Config
 from redbot.core.data_manager import cog_data_path
 from datetime import datetime, timedelta, timezone
 import asyncio
+import functools
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 import unicodedata
 import os
+import re
+import shutil
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import islice
 from pathlib import Path
 
 MAX_MSG = 1900  # stay safely below Discord's 2000 char limit
 MAX_LOG_BYTES = 1_000_000  # 1 MB cap for on-disk log
 MAX_LOG_DAYS = 14          # delete entries older than 14 days
 CLEANUP_EVERY_WRITES = 50  # run time-based cleanup every N writes
+LOG_FLUSH_SECS = 0.25      # how long a burst of log lines may gather before one disk write
+LOG_FLUSH_MAX_LINES = 200  # ...or sooner once this many lines are waiting
+
+ROLE_EDIT_CONCURRENCY = 10  # parallel add/remove role calls across all event role create/sync runs
+EVENT_ROLE_FLAGS = frozenset({"--ping", "--force"})  # trailing flags accepted by `event role`
+EVENTS_CACHE_TTL = 30  # seconds to reuse a guild's fetched scheduled events
+PREVIEW_DEBOUNCE_SECS = 0.3  # coalesce wizard preview edits made within this window
+SNOWFLAKE_RE = re.compile(r"[0-9]{15,25}")  # Discord IDs inside pasted links/mentions
+JOINED_INDEX_TTL = 60  # seconds a guild's sorted join-time index stays valid
+MEMBER_CHUNK_TIMEOUT = 30  # seconds to wait for a guild member chunk before using the cache as-is
+PUBLIC_VIEW_CACHE_MAX = 256  # reused published-post views kept before the oldest is dropped
+WIZARD_CACHE_MAX = 64  # wizard drafts whose preview state/control view is kept before the oldest is dropped
+
+# Shared, never mutated: built once instead of per send.
+NO_MENTIONS = discord.AllowedMentions.none()
+ROLE_PING_MENTIONS = discord.AllowedMentions(roles=True, users=False, everyone=False, replied_user=False)
 
 ACTIVITY_FLUSH_SECS = 60       # batch activity counters to config this often
 ACTIVITY_RETENTION_DAYS = 35   # keep daily activity buckets this long
 
 
+# Quote/space characters trimmed from names before comparing them.
+_STRIP_CHARS_ASCII = ' "\''
+_STRIP_CHARS = _STRIP_CHARS_ASCII + "\u201c\u201d\u2018\u2019"
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_text_cached(s: str) -> str:
+    """Pure body of DiscoOps._norm_text; event and division names repeat a lot."""
+    # ASCII is already NFKC and can't contain curly quotes: skip normalize().
+    if s.isascii():
+        return s.strip().strip(_STRIP_CHARS_ASCII).casefold()
+    if not unicodedata.is_normalized("NFKC", s):
+        s = unicodedata.normalize("NFKC", s)
+    s = s.strip().strip(_STRIP_CHARS)
+    return s.casefold()
+
+
+@functools.lru_cache(maxsize=512)
+def _quote_lines_cached(text: str) -> str:
+    """Pure body of DiscoOps._quote_lines; event descriptions are re-listed often."""
+    # The prefix rides on the join separator: no per-line concatenation.
+    return "> " + "\n> ".join(text.splitlines())
+
+
+@functools.lru_cache(maxsize=256)
+def _format_when_cached(starts_at: Optional[datetime], ends_at: Optional[datetime]) -> str:
+    """Pure body of DiscoOps._format_when; keyed by value, so edited times miss naturally."""
+    if not starts_at:
+        return "TBD"
+    when = discord.utils.format_dt(starts_at, style="F")
+    if ends_at:
+        when += f" → {discord.utils.format_dt(ends_at, style='t')}"
+    return when
+
+
+@functools.lru_cache(maxsize=16)
+def _format_comms_cached(comms: Tuple[str, ...]) -> str:
+    """Pure body of DiscoOps._format_comms."""
+    parts = []
+    if "DISCORD" in comms:
+        parts.append("Discord")
+    if "SRS" in comms:
+        parts.append("SRS")
+    return " + ".join(parts) if parts else "TBD"
+
+
+@functools.lru_cache(maxsize=32)
+def _status_title(name: str) -> str:
+    """Title-case an enum member name (EventStatus/EntityType come from a tiny set)."""
+    return name.title()
+
+
+@functools.lru_cache(maxsize=256)
+def _start_line(start_time: Optional[datetime]) -> str:
+    """Event start as full + relative Discord timestamps (naive times read as UTC)."""
+    if not start_time:
+        return "N/A"
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    epoch = int(start_time.timestamp())
+    return f"<t:{epoch}:F> • <t:{epoch}:R> (unix: `{epoch}`)"
+
+
 # --- Data models for Detailed Events Wizard ---
 
 @dataclass
@@ -70,6 +156,178 @@ class EventDraft:
     divisions: List[str] = field(default_factory=list)
 
 
+# --- Published post views ---
+
+class PublicView(discord.ui.View):
+    """Persistent buttons under a published event post (routed by on_interaction)."""
+
+    _BUTTONS = (
+        ("Interested", discord.ButtonStyle.primary, "interest"),
+        ("Sign Up / Manage Role", discord.ButtonStyle.success, "signup"),
+        ("View Details", discord.ButtonStyle.secondary, "view"),
+    )
+
+    def __init__(self, outer: "DiscoOps", event_id: str, is_disabled: bool):
+        super().__init__(timeout=None)
+        for label, style, action in self._BUTTONS:
+            self.add_item(
+                discord.ui.Button(
+                    label=label,
+                    style=style,
+                    custom_id=outer._public_view_custom_id(action, event_id),
+                    disabled=is_disabled,
+                )
+            )
+
+
+class SignupView(discord.ui.View):
+    """Ephemeral role picker shown after clicking Sign Up on a published post."""
+
+    def __init__(self, outer: "DiscoOps", event_id: str, owner_id: int, options: List[discord.SelectOption]):
+        super().__init__(timeout=120)
+        self.outer = outer
+        self.event_id = event_id
+        self.owner_id = owner_id
+        self.select_role = discord.ui.Select(placeholder="Pick your role…", options=options, min_values=1, max_values=1)
+        self.select_role.callback = self._on_select
+        self.add_item(self.select_role)
+
+    async def _on_select(self, inter: discord.Interaction):
+        if inter.user.id != self.owner_id:
+            return await inter.response.send_message("This menu is only for you.", ephemeral=True)
+        chosen = self.select_role.values[0]
+        await self.outer._apply_signup_choice(inter, event_id=self.event_id, role_id=str(chosen))
+        try:
+            self.stop()
+        except Exception:
+            pass
+
+
+# --- Wizard modals ---
+
+class DescriptionModal(discord.ui.Modal):
+    """Long description editor for a wizard draft."""
+
+    description = discord.ui.TextInput(
+        label="Long description (markdown ok)",
+        style=discord.TextStyle.long,
+        required=False,
+        max_length=4000,
+        placeholder="Add details, agenda, requirements, links…",
+    )
+
+    def __init__(self, outer: "DiscoOps", draft: EventDraft, return_mode: str):
+        super().__init__(title="Event Description")
+        self.outer = outer
+        self.draft = draft
+        self.return_mode = return_mode
+        self.description.default = draft.description_md or ""
+
+    async def on_submit(self, inter: discord.Interaction):
+        self.draft.description_md = (self.description.value or "")
+        try:
+            await inter.response.defer()
+        except Exception:
+            pass
+        await self.outer._refresh_preview(inter.guild, self.draft)
+        await self.outer._refresh_wizard_control(inter.guild, self.draft, mode=self.return_mode)
+
+
+class AddRoleModal(discord.ui.Modal):
+    """Step 2 of adding a role: role name + capacity within a division."""
+
+    role_name = discord.ui.TextInput(label="Role", required=True, max_length=50)
+    capacity = discord.ui.TextInput(label="Capacity (blank = unlimited)", required=False, max_length=6)
+
+    def __init__(self, outer: "DiscoOps", draft: EventDraft, division: str, return_mode: str):
+        super().__init__(title="Add Division Role")
+        self.outer = outer
+        self.draft = draft
+        self.division = division
+        self.return_mode = return_mode
+        self.role_name.label = f"Role in {division}"
+
+    async def on_submit(self, inter: discord.Interaction):
+        if len(self.draft.roles) >= 24:
+            return await inter.response.send_message("Max roles reached (24).", ephemeral=True)
+
+        rn = (self.role_name.value or "").strip()
+        if not rn:
+            return await inter.response.send_message("Role name is required.", ephemeral=True)
+
+        # Validate duplicate (division, role_name)
+        dn = self.outer._norm_text(self.division)
+        rnn = self.outer._norm_text(rn)
+        for existing in self.draft.roles.values():
+            if self.outer._norm_text(existing.division) == dn and self.outer._norm_text(existing.role_name) == rnn:
+                return await inter.response.send_message(
+                    f"That role already exists: **{self.division} — {rn}**",
+                    ephemeral=True,
+                )
+
+        cap_raw = (self.capacity.value or "").strip()
+        cap_val: Optional[int] = None
+        if cap_raw:
+            try:
+                cap_val = max(0, int(cap_raw))
+            except ValueError:
+                return await inter.response.send_message("Capacity must be a number.", ephemeral=True)
+
+        # len()+1 would collide with surviving IDs after a delete
+        # (r1,r2,r3 minus r1 -> next would be r3 again), so derive
+        # the next ID from the highest existing index instead.
+        max_idx = 0
+        for existing_rid in self.draft.roles:
+            try:
+                max_idx = max(max_idx, int(str(existing_rid).lstrip("r")))
+            except ValueError:
+                continue
+        rid = f"r{max_idx + 1}"
+        rd = RoleDraft(
+            role_id=rid,
+            division=self.division,
+            role_name=rn,
+            capacity=cap_val,
+        )
+        self.draft.roles[rid] = rd
+        self.draft.pending_emoji_role_id = rid
+
+        disp = self.outer._role_display_name(rd)
+        try:
+            await inter.response.defer()
+        except Exception:
+            pass
+
+        await self.outer._refresh_preview(inter.guild, self.draft)
+        await self.outer._refresh_wizard_control(inter.guild, self.draft, mode=self.return_mode)
+
+
+class SetEmojiModal(discord.ui.Modal):
+    """Emoji picker for a single wizard role."""
+
+    emoji = discord.ui.TextInput(label="Emoji", required=True, max_length=64, placeholder="React emoji or custom emoji")
+
+    def __init__(self, outer: "DiscoOps", draft: EventDraft, role_id: str, return_mode: str):
+        super().__init__(title="Set Role Emoji")
+        self.outer = outer
+        self.draft = draft
+        self.role_id = role_id
+        self.return_mode = return_mode
+
+    async def on_submit(self, inter: discord.Interaction):
+        e = (self.emoji.value or "").strip()
+        if self.role_id in (self.draft.roles or {}):
+            self.draft.roles[self.role_id].emoji = e or None
+        if self.draft.pending_emoji_role_id == self.role_id:
+            self.draft.pending_emoji_role_id = None
+        try:
+            await inter.response.defer()
+        except Exception:
+            pass
+        await self.outer._refresh_preview(inter.guild, self.draft)
+        await self.outer._refresh_wizard_control(inter.guild, self.draft, mode=self.return_mode)
+
+
 class DiscoOps(commands.Cog):
     """Operational features to make Discord server management easier."""
 
@@ -79,6 +337,10 @@ class DiscoOps(commands.Cog):
         default_guild = {
             "event_roles": {},  # Maps scheduled_event_id(str) -> role_id
             "event_posts": {},  # Maps wizard_event_id(str) -> published post data + signups
+            # Long descriptions live apart from event_posts so interest/signup
+            # clicks don't re-serialize them: wizard_event_id(str) -> markdown
+            "event_posts_desc": {},
+            "event_posts_index": {},  # Maps published message_id(str) -> wizard_event_id(str)
             "wizard_divisions": ["Hugin", "Munin", "Faffne", "Fenrir", "Idun"],
             "activity_enabled": True,
             # Daily engagement buckets: {"YYYY-MM-DD": {uid(str): [messages, voice_seconds]}}
@@ -86,16 +348,58 @@ class DiscoOps(commands.Cog):
         }
         self.config.register_guild(**default_guild)
 
+        # Shared by every bulk role edit, so overlapping syncs don't stack their caps.
+        self._role_sem = asyncio.Semaphore(ROLE_EDIT_CONCURRENCY)
+
         # Disk logging setup
         self._log_lock = asyncio.Lock()
+        # Held by the worker thread around the file handle. A cancelled flush
+        # drops _log_lock while its to_thread write keeps running; this one doesn't.
+        self._log_io_lock = threading.Lock()
         self._log_writes = 0  # in-memory only; just paces periodic cleanup
         data_dir = cog_data_path(self)
         data_dir.mkdir(parents=True, exist_ok=True)
         self._log_path = data_dir / "discoops.log"
+        self._log_fp = None  # binary append handle, opened by the first flush
+        self._log_size = 0   # bytes in the log file; tracked while _log_fp is open
+        # log_info only buffers; a background task writes batches to disk.
+        self._log_buf: List[str] = []
+        self._log_ts: Tuple[int, str] = (0, "")  # (epoch second, formatted stamp) of the last line
+        self._log_wake = asyncio.Event()
+        self._log_flush_task = asyncio.create_task(self._log_flush_loop())
+        # Last `logs` result, keyed by (st_mtime_ns, line count): (mtime, count, text)
+        self._logs_cache: Tuple[int, int, str] = (0, 0, "")
 
         # Detailed Events wizard storage
         self._drafts: Dict[int, EventDraft] = {}   # key: organizer user id -> EventDraft
         self._draft_locks: Dict[str, asyncio.Lock] = {}  # key: event_id -> lock
+        self._preview_tasks: Dict[str, asyncio.Task] = {}  # key: event_id -> pending preview refresh
+        # key: event_id -> (message id, last embed payload); bounded LRU, since
+        # abandoned drafts never reach the cleanup that would evict them
+        self._preview_sent: OrderedDict[str, Tuple[int, dict]] = OrderedDict()
+        # key: event_id -> live "main" control view; bounded LRU like _preview_sent
+        self._control_views: OrderedDict[str, discord.ui.View] = OrderedDict()
+        # Normalized wizard division names per guild, built on first add
+        self._division_norms: Dict[int, set] = {}
+
+        # Scheduled events per guild: guild_id -> (time.monotonic(), with_counts, events)
+        self._events_cache: Dict[int, Tuple[float, bool, list]] = {}
+        # Members sorted by join time: guild_id -> (built at, join timestamps, member ids)
+        self._joined_index: Dict[int, Tuple[float, List[float], List[int]]] = {}
+        # Name index over a cached events list: guild_id -> (events list, index)
+        self._events_index: Dict[int, Tuple[list, Dict[str, object]]] = {}
+
+        # Published post button views, reused for every edit of the same post:
+        # (wizard event id, disabled) -> PublicView
+        # Bounded LRU, so posts deleted outside the cog don't pin views forever.
+        self._public_views: OrderedDict[Tuple[str, bool], PublicView] = OrderedDict()
+
+        # Published post button routing: evtpub:<action>:<event_id> -> handler
+        self._pub_actions = {
+            "interest": self._handle_public_interest,
+            "signup": self._handle_public_signup,
+            "view": self._handle_public_view_details,
+        }
 
         # Activity tracking: counters buffer in memory and flush to config
         # periodically so busy servers don't cause a config write per message.
@@ -105,113 +409,278 @@ class DiscoOps(commands.Cog):
         self._act_enabled_cache: Dict[int, bool] = {}
         self._act_flush_task = asyncio.create_task(self._activity_flush_loop())
 
+    async def cog_load(self):
+        """Migrate stored wizard posts: int IDs, split-out descriptions and the message-id index."""
+        try:
+            all_guilds = await self.config.all_guilds()
+        except Exception:
+            return
+        for gid, data in all_guilds.items():
+            try:
+                posts = data.get("event_posts") or {}
+                descs = data.get("event_posts_desc") or {}
+                moved = self._split_post_descriptions(posts, descs)
+                coerced = self._coerce_post_ids(posts)
+                if moved:
+                    # Descriptions first, so an interrupted migration never loses one.
+                    await self.config.guild_from_id(gid).event_posts_desc.set(descs)
+                if moved or coerced:
+                    await self.config.guild_from_id(gid).event_posts.set(posts)
+                expected = self._build_post_index(posts)
+                if expected != (data.get("event_posts_index") or {}):
+                    await self.config.guild_from_id(gid).event_posts_index.set(expected)
+            except Exception:
+                continue
+
+    @staticmethod
+    def _coerce_post_ids(posts: dict) -> bool:
+        """Convert legacy string IDs in stored posts to ints, in place.
+
+        Returns True if anything changed (or an unusable ID was dropped).
+        """
+        changed = False
+        for post in posts.values():
+            if not isinstance(post, dict):
+                continue
+            for key in ("channel_id", "message_id", "linked_scheduled_event_id"):
+                val = post.get(key)
+                if val is None or isinstance(val, int):
+                    continue
+                try:
+                    post[key] = int(val)
+                except (TypeError, ValueError):
+                    post[key] = None
+                changed = True
+            detail_ids = post.get("details_message_ids")
+            if detail_ids and not all(isinstance(x, int) for x in detail_ids):
+                post["details_message_ids"] = [int(x) for x in detail_ids if str(x).isdigit()]
+                changed = True
+        return changed
+
+    @staticmethod
+    def _split_post_descriptions(posts: dict, descs: dict) -> bool:
+        """Move legacy inline description_md out of posts into descs, in place.
+
+        Returns True if any post carried one.
+        """
+        changed = False
+        for event_id, post in posts.items():
+            if not isinstance(post, dict) or "description_md" not in post:
+                continue
+            desc = post.pop("description_md")
+            if desc and not descs.get(event_id):
+                descs[event_id] = desc
+            changed = True
+        return changed
+
+    @staticmethod
+    def _build_post_index(posts: dict) -> Dict[str, str]:
+        """Map str(message_id) -> wizard event id for every tracked post."""
+        index: Dict[str, str] = {}
+        for eid, post in (posts or {}).items():
+            mid = (post or {}).get("message_id")
+            if mid:
+                index[str(mid)] = str(eid)
+        return index
+
     async def cog_unload(self):
-        """Stop the flush loop and persist any buffered activity."""
+        """Stop background tasks and persist any buffered activity and log lines."""
+        for task in self._preview_tasks.values():
+            task.cancel()
+        self._preview_tasks.clear()
         self._act_flush_task.cancel()
         try:
             await self._activity_flush()
         except Exception:
             pass
+        self._log_flush_task.cancel()
+        try:
+            await self._log_flush_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        try:
+            await self._log_flush()
+        except Exception:
+            pass
+        async with self._log_lock:
+            # Waits out any write a cancelled flush left running in its thread.
+            await asyncio.to_thread(self._release_log_fp)
 
     # --------- disk logger ----------
     async def log_info(self, message: str):
-        """Append a log line to disk, with rotation + retention.
+        """Queue a log line for disk; the flush loop writes it within LOG_FLUSH_SECS.
 
-        All file I/O runs in a worker thread so the event loop never blocks.
+        Rotation + retention run with the batched write, in a worker thread.
         """
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        line = f"[{ts}] {message}\n"
+        sec = int(time.time())
+        if sec != self._log_ts[0]:
+            # Bursts within one second reuse the stamp instead of re-running strftime.
+            self._log_ts = (sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"))
+        self._log_buf.append(f"[{self._log_ts[1]}] {message}\n")
+        # Wake the idle flush loop on the first buffered line, and again when full.
+        if len(self._log_buf) == 1 or len(self._log_buf) >= LOG_FLUSH_MAX_LINES:
+            self._log_wake.set()
+
+    async def _log_flush_loop(self):
+        try:
+            while True:
+                # Sleep without a timeout while there is nothing to write.
+                await self._log_wake.wait()
+                self._log_wake.clear()
+                # Let a burst accumulate for up to LOG_FLUSH_SECS (or until full).
+                if len(self._log_buf) < LOG_FLUSH_MAX_LINES:
+                    try:
+                        await asyncio.wait_for(self._log_wake.wait(), LOG_FLUSH_SECS)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._log_wake.clear()
+                try:
+                    await self._log_flush()
+                except Exception:
+                    pass
+        except asyncio.CancelledError:
+            pass
+
+    async def _log_flush(self):
+        """Write all buffered log lines in one append."""
+        if not self._log_buf:
+            return
         try:
             async with self._log_lock:
-                await asyncio.to_thread(self._write_log_line, line)
+                buf, self._log_buf = self._log_buf, []
+                if buf:
+                    await asyncio.to_thread(self._write_log_lines, buf)
         except Exception:
             # Logging must never disrupt bot flow
             pass
 
-    def _write_log_line(self, line: str):
+    def _write_log_lines(self, lines: List[str]):
         """Synchronous log append + rotation; call from a thread."""
-        try:
-            with open(self._log_path, "a", encoding="utf-8", newline="") as f:
-                f.write(line)
-            self._log_writes += 1
-
-            # Size-based cleanup first (fast path)
-            if self._log_path.exists() and self._log_path.stat().st_size > MAX_LOG_BYTES:
-                self._truncate_to_max_bytes()
-
-            # Time-based cleanup periodically
-            if self._log_writes % CLEANUP_EVERY_WRITES == 0:
-                self._time_prune_older_than(MAX_LOG_DAYS)
-                # Re-enforce size cap after time prune
-                if self._log_path.exists() and self._log_path.stat().st_size > MAX_LOG_BYTES:
+        with self._log_io_lock:
+            try:
+                if self._log_fp is None:
+                    self._log_fp = open(self._log_path, "ab")
+                    # Size is read once per open; rewrites close the handle, so it resyncs.
+                    self._log_size = os.fstat(self._log_fp.fileno()).st_size
+                # A lone surrogate (e.g. from a user-supplied name) must not cost the batch.
+                data = "".join(lines).encode("utf-8", errors="replace")
+                self._log_fp.write(data)
+                self._log_fp.flush()
+                self._log_size += len(data)
+                before = self._log_writes
+                self._log_writes += len(lines)
+
+                # Size-based cleanup first (fast path)
+                if self._log_size > MAX_LOG_BYTES:
                     self._truncate_to_max_bytes()
-        except (IOError, OSError):
-            # File I/O errors - don't disrupt bot flow
-            pass
+
+                # Time-based cleanup periodically (whenever a batch crosses a multiple)
+                if before // CLEANUP_EVERY_WRITES != self._log_writes // CLEANUP_EVERY_WRITES:
+                    self._time_prune_older_than(MAX_LOG_DAYS)
+                    # Re-enforce size cap after time prune (it checks the size itself)
+                    self._truncate_to_max_bytes()
+            except (IOError, OSError):
+                # File I/O errors - don't disrupt bot flow; reopen on next write
+                self._close_log_fp()
+
+    def _close_log_fp(self):
+        """Close the append handle (after rewrites); hold _log_io_lock. The next write reopens it."""
+        fp, self._log_fp = self._log_fp, None
+        if fp is not None:
+            try:
+                fp.close()
+            except (IOError, OSError):
+                pass
+
+    def _release_log_fp(self):
+        """Close the append handle once no write is in flight; call from a thread."""
+        with self._log_io_lock:
+            self._close_log_fp()
+
+    def _clear_log_file(self):
+        """Close the handle and delete the log file; call from a thread."""
+        with self._log_io_lock:
+            self._close_log_fp()
+            self._log_path.unlink(missing_ok=True)
+        self._logs_cache = (0, 0, "")
 
     def _truncate_to_max_bytes(self):
         """Trim the log file to keep only the last <= MAX_LOG_BYTES bytes aligned to lines."""
         try:
             p = self._log_path
-            if not p.exists():
-                return
-            size = p.stat().st_size
-            if size <= MAX_LOG_BYTES:
-                return
-            # Read tail
+            # A missing file raises FileNotFoundError (an OSError) from open;
+            # no separate exists()/stat() probes.
             with open(p, "rb") as f:
-                # read last MAX_LOG_BYTES bytes (plus small margin) if file is larger
-                seek_to = max(0, size - (MAX_LOG_BYTES * 2))
-                f.seek(seek_to)
-                tail = f.read()
-            # Keep only the last MAX_LOG_BYTES from the tail, aligned to line boundary
-            tail_text = tail.decode("utf-8", errors="ignore")
-            # Take last MAX_LOG_BYTES worth of text
-            tail_text = tail_text[-MAX_LOG_BYTES:]
-            # Ensure we start at a new line
-            first_nl = tail_text.find("\n")
-            if first_nl != -1:
-                tail_text = tail_text[first_nl + 1 :]
-            with open(p, "w", encoding="utf-8", newline="") as f:
-                f.write(tail_text)
-        except (IOError, OSError, UnicodeDecodeError):
+                size = os.fstat(f.fileno()).st_size
+                if size <= MAX_LOG_BYTES:
+                    return
+                # Work in bytes: skip to the first line boundary inside the last
+                # MAX_LOG_BYTES and copy from there, with no decode/encode.
+                f.seek(size - MAX_LOG_BYTES - 1)
+                f.readline()
+                tmp = p.with_suffix(".log.tmp")
+                with open(tmp, "wb") as out:
+                    shutil.copyfileobj(f, out, 64 * 1024)
+            self._close_log_fp()
+            os.replace(tmp, p)
+        except (IOError, OSError):
             # File operations can fail, but we don't want to break log truncation
             pass
 
     def _time_prune_older_than(self, days: int):
-        """Remove lines older than N days based on timestamp prefix."""
+        """Remove lines older than N days based on timestamp prefix.
+
+        Lines are appended in time order, so the cutoff is found by binary
+        search and only the tail after it is copied.
+        """
         try:
             p = self._log_path
-            if not p.exists():
-                return
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            kept_lines = []
-            with open(p, "r", encoding="utf-8") as f:
-                for ln in f:
-                    # Expected format: [YYYY-MM-DD HH:MM:SS UTC] message
-                    # Parse timestamp safely; if parse fails, keep the line.
-                    try:
-                        close = ln.find("]")
-                        if ln.startswith("[") and close != -1:
-                            ts_str = ln[1:close]  # e.g. 2025-09-06 22:18:15 UTC
-                            dt = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S %Z")
-                            # treat naive as UTC just in case
-                            if dt.tzinfo is None:
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            if dt >= cutoff:
-                                kept_lines.append(ln)
-                        else:
-                            kept_lines.append(ln)
-                    except ValueError:
-                        # Timestamp parsing failed (strptime), keep the line
-                        kept_lines.append(ln)
-            # Write back
-            with open(p, "w", encoding="utf-8", newline="") as f:
-                f.writelines(kept_lines)
-        except (IOError, OSError, UnicodeDecodeError):
+            cutoff_prefix = cutoff.strftime("%Y-%m-%d %H:%M:%S").encode()
+            with open(p, "rb") as f:
+                offset = self._find_cutoff_offset(f, cutoff_prefix)
+                if offset == 0:
+                    return  # nothing old enough to drop
+                tmp = p.with_suffix(".log.tmp")
+                with open(tmp, "wb") as out:
+                    f.seek(offset)
+                    shutil.copyfileobj(f, out, 64 * 1024)
+            self._close_log_fp()
+            os.replace(tmp, p)
+        except (IOError, OSError):
             # File operations can fail during pruning
             pass
 
+    @staticmethod
+    def _find_cutoff_offset(f, cutoff_prefix: bytes) -> int:
+        """Byte offset of the first line stamped at/after `cutoff_prefix`.
+
+        Lines look like `[YYYY-MM-DD HH:MM:SS UTC] message`; that prefix sorts
+        lexicographically. Unstamped lines go with the next stamped line, and
+        the file end is returned when every line is older.
+        """
+        def first_stamp_from(pos: int):
+            # Start of the first line beginning at or after `pos`, plus its stamp.
+            f.seek(max(0, pos - 1))
+            if pos:
+                f.readline()
+            start = f.tell()
+            for line in iter(f.readline, b""):
+                if line[:1] == b"[" and line[20:21] == b" ":
+                    return start, line[1:20]
+            return start, None
+
+        f.seek(0, os.SEEK_END)
+        lo, hi = 0, f.tell()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            _start, stamp = first_stamp_from(mid)
+            if stamp is None or stamp >= cutoff_prefix:
+                hi = mid
+            else:
+                lo = mid + 1
+        return first_stamp_from(lo)[0]
+
     async def _logs_tail(self, count: int) -> str:
         """Return the last `count` lines from disk, efficiently."""
         return await asyncio.to_thread(self._logs_tail_sync, count)
@@ -219,17 +688,39 @@ class DiscoOps(commands.Cog):
     def _logs_tail_sync(self, count: int) -> str:
         try:
             p = self._log_path
-            if not p.exists():
+            try:
+                mtime = p.stat().st_mtime_ns
+            except FileNotFoundError:
                 return ""
-            # Read up to ~1.2MB to be safe; file is capped at 1MB anyway.
+            # Unchanged file + same request: skip the disk read entirely.
+            if (mtime, count) == self._logs_cache[:2]:
+                return self._logs_cache[2]
+            # Read backwards in 8 KiB blocks until we hold more than `count`
+            # non-blank lines (the first may be partial), or hit the start.
+            # Lines stay bytes until the final `count` are picked, so only
+            # those get decoded.
+            blocks: List[bytes] = []
+            newlines = 0
+            kept: Optional[List[bytes]] = None
             with open(p, "rb") as f:
-                f.seek(0, os.SEEK_END)
-                size = f.tell()
-                to_read = min(size, 1_200_000)
-                f.seek(max(0, size - to_read))
-                blob = f.read().decode("utf-8", errors="ignore")
-            lines = [ln for ln in blob.splitlines() if ln.strip()]
-            return "\n".join(lines[-count:]) if lines else ""
+                pos = f.seek(0, os.SEEK_END)
+                while pos > 0:
+                    step = min(8192, pos)
+                    pos -= step
+                    f.seek(pos)
+                    block = f.read(step)
+                    blocks.append(block)
+                    newlines += block.count(b"\n")
+                    if newlines > count:
+                        kept = [ln for ln in b"".join(reversed(blocks)).splitlines() if ln.strip()]
+                        if len(kept) > count:
+                            break
+                        kept = None
+            if kept is None:
+                kept = [ln for ln in b"".join(reversed(blocks)).splitlines() if ln.strip()]
+            text = b"\n".join(kept[-count:]).decode("utf-8", errors="ignore")
+            self._logs_cache = (mtime, count, text)
+            return text
         except (IOError, OSError, UnicodeDecodeError):
             return ""
 
@@ -239,44 +730,125 @@ class DiscoOps(commands.Cog):
         """Normalize text for comparisons (NFKC + strip quotes + casefold)."""
         if s is None:
             return ""
-        s = unicodedata.normalize("NFKC", s).strip()
-        s = s.strip(' "\'“”‘’')
-        return s.casefold()
+        return _norm_text_cached(s)
 
     @staticmethod
     def _quote_lines(text: str) -> str:
         """Prefix every line with '> ' to keep multi-line descriptions inside the quote."""
         if not text:
             return ""
-        lines = text.splitlines()
-        return "\n".join("> " + ln for ln in lines)
+        return _quote_lines_cached(text)
 
     @staticmethod
-    async def _get_scheduled_events(guild, with_counts: bool = True):
-        """Safely fetch scheduled events across discord.py versions."""
+    def _split_markdown(text: str, limit: int = MAX_MSG):
+        """Yield line-aligned chunks of `text` no longer than `limit` (unless a single line is)."""
+        buf: List[str] = []
+        size = 0
+        for ln in text.splitlines() or [text]:
+            if not size:
+                buf, size = [ln], len(ln)
+            elif size + 1 + len(ln) > limit:
+                yield "\n".join(buf)
+                buf, size = [ln], len(ln)
+            else:
+                buf.append(ln)
+                size += 1 + len(ln)
+        if size:
+            yield "\n".join(buf)
+
+    async def _get_scheduled_events(self, guild, with_counts: bool = True):
+        """Safely fetch scheduled events across discord.py versions.
+
+        Results are reused for EVENTS_CACHE_TTL seconds; a cached fetch with
+        counts also serves callers that don't need them.
+        """
+        now = time.monotonic()
+        cached = self._events_cache.get(guild.id)
+        if cached and now - cached[0] < EVENTS_CACHE_TTL and (cached[1] or not with_counts):
+            return cached[2]
         try:
-            return await guild.fetch_scheduled_events(with_counts=with_counts)
+            events = await guild.fetch_scheduled_events(with_counts=with_counts)
         except TypeError:
             # Older discord.py version doesn't support with_counts parameter
             try:
-                return await guild.fetch_scheduled_events()
+                events = await guild.fetch_scheduled_events()
             except (discord.Forbidden, discord.HTTPException):
                 return []
         except (AttributeError, discord.Forbidden, discord.HTTPException):
             # Guild doesn't have scheduled events feature or bot lacks permissions
             return []
+        self._events_cache[guild.id] = (now, with_counts, events)
+        return events
+
+    def _invalidate_events(self, guild_id: int):
+        self._events_cache.pop(guild_id, None)
+        self._events_index.pop(guild_id, None)
+
+    def _events_index_for(self, guild_id: int, events: list) -> Dict[str, object]:
+        """Name index for `events`, reused while the same fetched list is cached."""
+        cached = self._events_index.get(guild_id)
+        if cached is not None and cached[0] is events:
+            return cached[1]
+        index = self._index_events(events)
+        self._events_index[guild_id] = (events, index)
+        return index
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_create(self, event: discord.GuildScheduledEvent):
+        self._invalidate_events(event.guild_id)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_update(self, before: discord.GuildScheduledEvent, after: discord.GuildScheduledEvent):
+        self._invalidate_events(after.guild_id)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_delete(self, event: discord.GuildScheduledEvent):
+        self._invalidate_events(event.guild_id)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_user_add(self, event: discord.GuildScheduledEvent, user: discord.User):
+        self._invalidate_events(event.guild_id)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_user_remove(self, event: discord.GuildScheduledEvent, user: discord.User):
+        self._invalidate_events(event.guild_id)
+
+    @classmethod
+    def _index_events(cls, events) -> Dict[str, object]:
+        """Map normalized name -> event (first event wins on duplicate names)."""
+        index: Dict[str, object] = {}
+        for e in events or []:
+            index.setdefault(cls._norm_text(getattr(e, "name", "")), e)
+        return index
 
     @classmethod
     def _event_match(cls, events, query: str):
-        """Find event by normalized exact name, then partial match."""
+        """Find event by normalized exact name, then partial match.
+
+        `events` may be a list of events or a prebuilt `_index_events()` dict.
+        A list is matched in one pass without building an index.
+        """
         nq = cls._norm_text(query)
-        for e in events:
-            if cls._norm_text(getattr(e, "name", "")) == nq:
-                return e
-        for e in events:
-            if nq in cls._norm_text(getattr(e, "name", "")):
-                return e
-        return None
+        if not isinstance(events, dict):
+            partial = None
+            for e in events or []:
+                name = cls._norm_text(getattr(e, "name", ""))
+                if name == nq:
+                    return e
+                if partial is None and nq in name:
+                    partial = e
+            return partial
+        index = events
+        hit = index.get(nq)
+        if hit is not None or not index:
+            return hit
+        # Substring fallback: one str.find over NUL-joined names, first name wins.
+        names = list(index)
+        haystack = "\0".join(names)
+        pos = haystack.find(nq) if "\0" not in nq else -1
+        if pos < 0:
+            return None
+        return index[names[haystack.count("\0", 0, pos)]]
 
     @staticmethod
     async def _send_paginated(
@@ -291,60 +863,69 @@ class DiscoOps(commands.Cog):
     ):
         """
         Send plain text chunks split below Discord's limit.
-        `chunks` can be a list of strings (sections).
+        `chunks` can be any iterable of strings (sections), including a
+        generator; pages are sent as soon as they fill up.
 
         Mentions are disabled by default to prevent mass-pings.
         If you intentionally want a ping, pass `ping="..."` (sent as a final message).
         """
         header = header or ""
         footer = footer or ""
-        allowed_mentions = allowed_mentions or discord.AllowedMentions.none()
-        ping_mentions = ping_mentions or discord.AllowedMentions(
-            roles=True, users=False, everyone=False, replied_user=False
-        )
+        allowed_mentions = allowed_mentions or NO_MENTIONS
+        ping_mentions = ping_mentions or ROLE_PING_MENTIONS
+
+        def safe_parts():
+            # Hard-split any single section that exceeds the limit; otherwise a
+            # page would exceed 2000 chars and Discord rejects it with HTTP 400.
+            for part in chunks:
+                while len(part) > MAX_MSG:
+                    cut = part.rfind("\n", 0, MAX_MSG)
+                    if cut <= 0:
+                        cut = MAX_MSG
+                    yield part[:cut]
+                    part = part[cut:].lstrip("\n")
+                if part:
+                    yield part
+
+        last_page = None
+
+        async def emit(page: str):
+            nonlocal last_page
+            last_page = page
+            if page.strip():
+                await ctx.send(page, allowed_mentions=allowed_mentions)
 
-        # Hard-split any single section that exceeds the limit; otherwise a
-        # page would exceed 2000 chars and Discord rejects it with HTTP 400.
-        safe_chunks = []
-        for part in chunks:
-            while len(part) > MAX_MSG:
-                cut = part.rfind("\n", 0, MAX_MSG)
-                if cut <= 0:
-                    cut = MAX_MSG
-                safe_chunks.append(part[:cut])
-                part = part[cut:].lstrip("\n")
-            if part:
-                safe_chunks.append(part)
-
-        pages = []
-        current = header + ("\n\n" if header else "")
-        for part in safe_chunks:
-            sep = "" if current.endswith("\n") or current == "" else "\n"
-            addition = f"{sep}{part}"
-            if len(current) + len(addition) + (len("\n\n" + footer) if footer else 0) > MAX_MSG:
-                pages.append(current.rstrip())
-                current = part
+        # Pages are built as a list of pieces plus a running length and
+        # joined once when flushed, instead of re-copying a growing string.
+        footer_room = len("\n\n" + footer) if footer else 0
+        pieces: List[str] = [header, "\n\n"] if header else []
+        cur_len = len(header) + 2 if header else 0
+        for part in safe_parts():
+            sep = "" if cur_len == 0 or pieces[-1].endswith("\n") else "\n"
+            if cur_len + len(sep) + len(part) + footer_room > MAX_MSG:
+                await emit("".join(pieces).rstrip())
+                pieces, cur_len = [part], len(part)
             else:
-                current += addition
+                if sep:
+                    pieces.append(sep)
+                pieces.append(part)
+                cur_len += len(sep) + len(part)
+        current = "".join(pieces)
         if current.strip():
-            pages.append(
+            await emit(
                 (
                     current
                     + (
                         "\n\n" + footer
-                        if footer and len(current) + len("\n\n" + footer) <= MAX_MSG
+                        if footer and len(current) + footer_room <= MAX_MSG
                         else ""
                     )
                 ).rstrip()
             )
 
         # If footer didn't fit on the last page, push separately
-        if footer and (not pages or not pages[-1].endswith(footer)):
-            pages.append(footer)
-
-        for page in pages:
-            if page.strip():
-                await ctx.send(page, allowed_mentions=allowed_mentions)
+        if footer and (last_page is None or not last_page.endswith(footer)):
+            await emit(footer)
 
         if ping:
             await ctx.send(ping, allowed_mentions=ping_mentions)
@@ -381,10 +962,7 @@ class DiscoOps(commands.Cog):
         title = (draft.title or "Untitled Event").strip()
         when = "TBD"
         try:
-            if draft.starts_at:
-                when = discord.utils.format_dt(draft.starts_at, style="F")
-                if draft.ends_at:
-                    when += f" → {discord.utils.format_dt(draft.ends_at, style='t')}"
+            when = self._format_when(draft)
         except Exception:
             pass
 
@@ -425,13 +1003,22 @@ class DiscoOps(commands.Cog):
                 return
             content = self._build_wizard_control_content(draft, mode=mode)
             view = self._build_wizard_control_view(draft, mode=mode)
-            await msg.edit(content=content, view=view, allowed_mentions=discord.AllowedMentions.none())
+            await msg.edit(content=content, view=view, allowed_mentions=NO_MENTIONS)
         except Exception:
             pass
 
     def _build_wizard_control_view(self, draft: EventDraft, *, mode: str) -> discord.ui.View:
-        """Build a single in-channel control panel view (no extra bot messages)."""
+        """Build a single in-channel control panel view (no extra bot messages).
+
+        The "main" panel doesn't depend on draft state, so its view is built
+        once per draft and reused until it times out.
+        """
         outer = self
+        if mode == "main":
+            cached = self._control_views.get(draft.event_id)
+            if cached is not None and not cached.is_finished():
+                self._control_views.move_to_end(draft.event_id)
+                return cached
 
         class ControlView(discord.ui.View):
             def __init__(self):
@@ -503,6 +1090,10 @@ class DiscoOps(commands.Cog):
             btn_cancel.callback = on_cancel
             view.add_item(btn_cancel)
 
+            outer._control_views[draft.event_id] = view
+            outer._control_views.move_to_end(draft.event_id)
+            if len(outer._control_views) > WIZARD_CACHE_MAX:
+                outer._control_views.popitem(last=False)
             return view
 
         # ---- roles ----
@@ -640,8 +1231,8 @@ class DiscoOps(commands.Cog):
             async def on_sync(inter: discord.Interaction):
                 if not await view._check(inter):
                     return
+                # The preview embed doesn't show this flag; only the panel changes.
                 draft.sync_back_to_calendar = not draft.sync_back_to_calendar
-                await outer._refresh_preview(inter.guild, draft)
                 await inter.response.edit_message(
                     content=outer._build_wizard_control_content(draft, mode="options"),
                     view=outer._build_wizard_control_view(draft, mode="options"),
@@ -792,6 +1383,12 @@ class DiscoOps(commands.Cog):
             return div
         return "Role"
 
+    @classmethod
+    def _role_label(cls, r: RoleDraft) -> str:
+        """Display name prefixed with the role emoji, when one is set."""
+        base = cls._role_display_name(r)
+        return f"{r.emoji} {base}" if r.emoji else base
+
     @staticmethod
     def _role_to_dict(r: RoleDraft) -> dict:
         return {
@@ -866,8 +1463,7 @@ class DiscoOps(commands.Cog):
             else:
                 open_slots = max(0, int(cap) - occupied)
                 slot_str = f"{occupied}/{cap_str} ({open_slots} open)"
-            base = self._role_display_name(rd_obj)
-            label = f"{rd_obj.emoji} {base}" if rd_obj.emoji else base
+            label = self._role_label(rd_obj)
             extra = f" — {rd_obj.description}" if rd_obj.description else ""
             role_lines.append(f"- {label} — {slot_str}{extra}")
 
@@ -901,30 +1497,31 @@ class DiscoOps(commands.Cog):
             message_id = post.get("message_id")
             if not channel_id or not message_id:
                 return
-            ch = guild.get_channel(int(channel_id))
+            ch = guild.get_channel(channel_id)
             if not ch:
+                self._drop_public_views(event_id)
                 return
             try:
-                msg = await ch.fetch_message(int(message_id))
+                msg = await ch.fetch_message(message_id)
+            except discord.NotFound:
+                self._drop_public_views(event_id)
+                return
             except Exception:
                 return
             content = self._build_public_markdown(post)
             view = self._build_public_view(event_id=str(event_id), disabled=False)
-            await msg.edit(content=content, embed=None, view=view, allowed_mentions=discord.AllowedMentions.none())
+            await msg.edit(content=content, embed=None, view=view, allowed_mentions=NO_MENTIONS)
         except Exception:
             pass
 
     @staticmethod
     def _format_comms(draft: EventDraft) -> str:
-        vals = set(draft.comms or [])
-        if not vals:
-            return "TBD"
-        parts = []
-        if "DISCORD" in vals:
-            parts.append("Discord")
-        if "SRS" in vals:
-            parts.append("SRS")
-        return " + ".join(parts) if parts else "TBD"
+        return _format_comms_cached(tuple(draft.comms or ()))
+
+    @staticmethod
+    def _format_when(draft: EventDraft) -> str:
+        """Start (full) → end (time) as Discord timestamps, or TBD."""
+        return _format_when_cached(draft.starts_at, draft.ends_at)
 
     def _draft_lock(self, event_id: str) -> asyncio.Lock:
         """Get or create a lock for a specific event draft."""
@@ -939,11 +1536,7 @@ class DiscoOps(commands.Cog):
         """Build the preview embed for an event draft."""
         title = draft.title or "Untitled Event"
         e = discord.Embed(title=f"📝 {title} • DRAFT", colour=discord.Colour.blurple())
-        when = "TBD"
-        if draft.starts_at:
-            when = discord.utils.format_dt(draft.starts_at, style="F")
-            if draft.ends_at:
-                when += f" → {discord.utils.format_dt(draft.ends_at, style='t')}"
+        when = self._format_when(draft)
         e.description = (
             f"**Status:** DRAFT (not published)\n"
             f"**When:** {when}\n"
@@ -957,18 +1550,41 @@ class DiscoOps(commands.Cog):
         # Roles summary
         if draft.roles:
             role_lines = []
+            used = 0
             for r in draft.roles.values():
                 cap = "∞" if r.capacity is None else r.capacity
-                base = self._role_display_name(r)
-                label = f"{r.emoji} {base}" if r.emoji else base
+                label = self._role_label(r)
                 extra = f" — {r.description}" if r.description else ""
-                role_lines.append(f"• {label} ({cap}){extra}")
+                line = f"• {label} ({cap}){extra}"
+                role_lines.append(line)
+                used += len(line) + 1
+                if used > 1024:
+                    break  # field is cut at 1024 chars; later roles would be sliced off anyway
             e.add_field(name="Roles", value="\n".join(role_lines)[:1024], inline=False)
 
         e.set_footer(text=f"Preview • Event ID: {draft.event_id}")
         return e
 
     async def _refresh_preview(self, guild: discord.Guild, draft: EventDraft):
+        """Schedule a preview refresh; changes within PREVIEW_DEBOUNCE_SECS share one edit."""
+        pending = self._preview_tasks.get(draft.event_id)
+        if pending is not None and not pending.done():
+            return  # the pending refresh renders the draft as it is when it fires
+        self._preview_tasks[draft.event_id] = asyncio.create_task(self._refresh_preview_later(guild, draft))
+
+    async def _refresh_preview_later(self, guild: discord.Guild, draft: EventDraft):
+        try:
+            await asyncio.sleep(PREVIEW_DEBOUNCE_SECS)
+            # Changes from here on schedule a fresh refresh.
+            self._preview_tasks.pop(draft.event_id, None)
+            await self._do_refresh_preview(guild, draft)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            # Nobody awaits this task, so record the failure instead of losing it.
+            await self.log_info(f"preview refresh failed: event={draft.event_id} guild={guild.id} err={e!r}")
+
+    async def _do_refresh_preview(self, guild: discord.Guild, draft: EventDraft):
         """Refresh the preview message for an event draft."""
         if not draft.preview_message_id or not draft.draft_channel_id:
             return
@@ -976,12 +1592,36 @@ class DiscoOps(commands.Cog):
         if not channel:
             return
         embed = self._build_preview_embed(draft)
+        payload = embed.to_dict()
+        # Same message, same rendered embed: nothing for Discord to change.
+        if self._preview_sent.get(draft.event_id) == (draft.preview_message_id, payload):
+            return
         try:
             msg = await channel.fetch_message(draft.preview_message_id)
             await msg.edit(embed=embed, view=None)
         except discord.NotFound:
+            # Cleanup may have deleted the preview while this refresh was in
+            # flight; only a draft that is still open gets a new one.
+            if self._drafts.get(draft.creator_id) is not draft or draft.status in ("PUBLISHING", "PUBLISHED"):
+                return
             new_msg = await channel.send(embed=embed, view=None)
             draft.preview_message_id = new_msg.id
+        self._remember_preview(draft.event_id, draft.preview_message_id, payload)
+
+    def _remember_preview(self, event_id: str, message_id: int, payload: dict):
+        """Record the last preview sent for a draft, dropping the oldest past WIZARD_CACHE_MAX."""
+        self._preview_sent[event_id] = (message_id, payload)
+        self._preview_sent.move_to_end(event_id)
+        if len(self._preview_sent) > WIZARD_CACHE_MAX:
+            self._preview_sent.popitem(last=False)
+
+    def _forget_draft_caches(self, event_id: str):
+        """Cancel a draft's pending preview refresh and drop its cached preview and control view."""
+        pending = self._preview_tasks.pop(event_id, None)
+        if pending is not None:
+            pending.cancel()
+        self._preview_sent.pop(event_id, None)
+        self._control_views.pop(event_id, None)
 
     async def _resolve_scheduled_event(self, guild: discord.Guild, ev_id: int) -> Optional[discord.GuildScheduledEvent]:
         """Resolve a scheduled event by id, with fallbacks."""
@@ -1013,6 +1653,10 @@ class DiscoOps(commands.Cog):
             draft_channel_id=channel_id,
             title=preset_title or "",
         )
+        previous = self._drafts.get(organizer.id)
+        if previous is not None:
+            # The replaced draft never reaches cleanup; don't leave its state cached.
+            self._forget_draft_caches(previous.event_id)
         self._drafts[organizer.id] = draft
 
         try:
@@ -1023,10 +1667,11 @@ class DiscoOps(commands.Cog):
         embed = self._build_preview_embed(draft)
         preview = await channel.send(embed=embed, view=None)
         draft.preview_message_id = preview.id
+        self._remember_preview(draft.event_id, preview.id, embed.to_dict())
 
         ctrl_content = self._build_wizard_control_content(draft, mode="main")
         ctrl_view = self._build_wizard_control_view(draft, mode="main")
-        ctrl = await channel.send(ctrl_content, view=ctrl_view, allowed_mentions=discord.AllowedMentions.none())
+        ctrl = await channel.send(ctrl_content, view=ctrl_view, allowed_mentions=NO_MENTIONS)
         draft.control_message_id = ctrl.id
         return draft
 
@@ -1058,7 +1703,7 @@ class DiscoOps(commands.Cog):
                 for ev in self.scheduled_events[:25]:
                     label = (ev.name or "Untitled")[:100]
                     starts = ev.start_time.strftime("%Y-%m-%d %H:%M") if ev.start_time else "TBD"
-                    desc = f"{starts} • {str(ev.entity_type).split('.')[-1].title()}"
+                    desc = f"{starts} • {_status_title(str(ev.entity_type).split('.')[-1])}"
                     opts.append(discord.SelectOption(label=label, description=desc[:100], value=str(ev.id)))
                 select = discord.ui.Select(placeholder="Pick a scheduled event…", options=opts)
 
@@ -1099,6 +1744,7 @@ class DiscoOps(commands.Cog):
             async def refresh(self, interaction: discord.Interaction, button: discord.ui.Button):
                 if interaction.user.id != organizer_id:
                     return await outer._send_ephemeral(interaction, "Only the organizer can refresh.")
+                outer._invalidate_events(interaction.guild.id)
                 new_list = await outer._get_scheduled_events(interaction.guild, with_counts=False)
                 # Create a new view instead of trying to re-add buttons
                 new_view = EventPicker(new_list if new_list else [])
@@ -1138,7 +1784,7 @@ class DiscoOps(commands.Cog):
             "Select a scheduled event to import details:",
             view=EventPicker(scheduled),
             delete_after=300,
-            allowed_mentions=discord.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
         )
 
     async def _open_paste_event_modal(self, interaction: discord.Interaction, channel_id: int):
@@ -1152,11 +1798,9 @@ class DiscoOps(commands.Cog):
                 await outer._defer_ephemeral(inter)
 
                 raw = (self.ev_input.value or "").strip()
-                ev_id = None
-                tokenized = raw.replace("<", "").replace(">", "").split("/")
-                for token in tokenized:
-                    if token.isdigit():
-                        ev_id = int(token)
+                # Event URLs end in .../events/<guild_id>/<event_id>: take the last ID.
+                ids = SNOWFLAKE_RE.findall(raw)
+                ev_id = int(ids[-1]) if ids else None
                 if not ev_id:
                     return await outer._send_ephemeral(inter, "Couldn't find an event ID in that input.")
 
@@ -1197,11 +1841,8 @@ class DiscoOps(commands.Cog):
                 ch_id = existing.get("channel_id")
                 msg_id = existing.get("message_id")
                 jump = ""
-                try:
-                    if ch_id and msg_id:
-                        jump = f"https://discord.com/channels/{interaction.guild.id}/{int(ch_id)}/{int(msg_id)}"
-                except Exception:
-                    jump = ""
+                if ch_id and msg_id:
+                    jump = f"https://discord.com/channels/{interaction.guild.id}/{ch_id}/{msg_id}"
                 msg = "A wizard post already exists for that scheduled event. Delete it first if you want to recreate it."
                 if jump:
                     msg += f"\n\nExisting post: {jump}"
@@ -1217,151 +1858,49 @@ class DiscoOps(commands.Cog):
 
         draft.description_md = (ev.description or "").strip()
 
+        image_url = None
         try:
-            if hasattr(ev, "image") and ev.image:
-                draft.image_url = ev.image.url
+            image = getattr(ev, "image", None)
+            if image:
+                image_url = draft.image_url = image.url
         except Exception:
             pass
 
+        snapshot = draft.linked_snapshot
         if ev.creator:
-            draft.linked_snapshot["calendar_creator_id"] = ev.creator.id
-
-        draft.linked_snapshot.update({
-            "name": ev.name,
-            "start": ev.start_time.isoformat() if ev.start_time else None,
-            "end": ev.end_time.isoformat() if ev.end_time else None,
-            "entity_type": str(ev.entity_type),
-            "location": getattr(ev.entity_metadata, "location", None) if ev.entity_metadata else None,
-            "description": ev.description,
-            "image": getattr(ev.image, "url", None) if hasattr(ev, "image") and ev.image else None,
-        })
+            snapshot["calendar_creator_id"] = ev.creator.id
+        metadata = ev.entity_metadata
+        start, end = ev.start_time, ev.end_time
+        snapshot["name"] = ev.name
+        snapshot["start"] = start.isoformat() if start else None
+        snapshot["end"] = end.isoformat() if end else None
+        snapshot["entity_type"] = str(ev.entity_type)
+        snapshot["location"] = getattr(metadata, "location", None) if metadata else None
+        snapshot["description"] = ev.description
+        snapshot["image"] = image_url
 
         await self._refresh_preview(interaction.guild, draft)
         await self._refresh_wizard_control(interaction.guild, draft, mode="main")
 
     def _create_description_modal(self, draft: EventDraft, *, return_mode: str = "main"):
         """Create a description modal for the given draft."""
-        outer = self
-
-        class DescriptionModal(discord.ui.Modal):
-            def __init__(self):
-                super().__init__(title="Event Description")
-
-            description = discord.ui.TextInput(
-                label="Long description (markdown ok)",
-                style=discord.TextStyle.long,
-                required=False,
-                max_length=4000,
-                placeholder="Add details, agenda, requirements, links…",
-                default=draft.description_md or ""
-            )
-
-            async def on_submit(self, inter: discord.Interaction):
-                draft.description_md = (self.description.value or "")
-                try:
-                    await inter.response.defer()
-                except Exception:
-                    pass
-                await outer._refresh_preview(inter.guild, draft)
-                await outer._refresh_wizard_control(inter.guild, draft, mode=return_mode)
-
-        return DescriptionModal()
+        return DescriptionModal(self, draft, return_mode)
 
     def _create_add_role_modal(self, draft: EventDraft, *, division: str, return_mode: str = "roles") -> discord.ui.Modal:
         """Step 2: enter role name + capacity."""
-        outer = self
-        division = (division or "").strip()
-
-        class AddRoleModal(discord.ui.Modal):
-            def __init__(self):
-                super().__init__(title="Add Division Role")
-
-            role_name = discord.ui.TextInput(label=f"Role in {division}", required=True, max_length=50)
-            capacity = discord.ui.TextInput(label="Capacity (blank = unlimited)", required=False, max_length=6)
-
-            async def on_submit(self, inter: discord.Interaction):
-                if len(draft.roles) >= 24:
-                    return await inter.response.send_message("Max roles reached (24).", ephemeral=True)
-
-                rn = (self.role_name.value or "").strip()
-                if not rn:
-                    return await inter.response.send_message("Role name is required.", ephemeral=True)
-
-                # Validate duplicate (division, role_name)
-                dn = outer._norm_text(division)
-                rnn = outer._norm_text(rn)
-                for existing in draft.roles.values():
-                    if outer._norm_text(existing.division) == dn and outer._norm_text(existing.role_name) == rnn:
-                        return await inter.response.send_message(
-                            f"That role already exists: **{division} — {rn}**",
-                            ephemeral=True,
-                        )
-
-                cap_raw = (self.capacity.value or "").strip()
-                cap_val: Optional[int] = None
-                if cap_raw:
-                    try:
-                        cap_val = max(0, int(cap_raw))
-                    except ValueError:
-                        return await inter.response.send_message("Capacity must be a number.", ephemeral=True)
-
-                # len()+1 would collide with surviving IDs after a delete
-                # (r1,r2,r3 minus r1 -> next would be r3 again), so derive
-                # the next ID from the highest existing index instead.
-                max_idx = 0
-                for existing_rid in draft.roles:
-                    try:
-                        max_idx = max(max_idx, int(str(existing_rid).lstrip("r")))
-                    except ValueError:
-                        continue
-                rid = f"r{max_idx + 1}"
-                rd = RoleDraft(
-                    role_id=rid,
-                    division=division,
-                    role_name=rn,
-                    capacity=cap_val,
-                )
-                draft.roles[rid] = rd
-                draft.pending_emoji_role_id = rid
-
-                disp = outer._role_display_name(rd)
-                try:
-                    await inter.response.defer()
-                except Exception:
-                    pass
-
-                await outer._refresh_preview(inter.guild, draft)
-                await outer._refresh_wizard_control(inter.guild, draft, mode=return_mode)
-
-        return AddRoleModal()
+        return AddRoleModal(self, draft, (division or "").strip(), return_mode)
 
     def _create_set_emoji_modal(self, draft: EventDraft, *, role_id: str, return_mode: str = "roles") -> discord.ui.Modal:
-        outer = self
-        role_id = str(role_id or "")
-
-        class SetEmojiModal(discord.ui.Modal):
-            def __init__(self):
-                super().__init__(title="Set Role Emoji")
-
-            emoji = discord.ui.TextInput(label="Emoji", required=True, max_length=64, placeholder="React emoji or custom emoji")
-
-            async def on_submit(self, inter: discord.Interaction):
-                e = (self.emoji.value or "").strip()
-                if role_id in (draft.roles or {}):
-                    draft.roles[role_id].emoji = e or None
-                if draft.pending_emoji_role_id == role_id:
-                    draft.pending_emoji_role_id = None
-                try:
-                    await inter.response.defer()
-                except Exception:
-                    pass
-                await outer._refresh_preview(inter.guild, draft)
-                await outer._refresh_wizard_control(inter.guild, draft, mode=return_mode)
-
-        return SetEmojiModal()
+        return SetEmojiModal(self, draft, str(role_id or ""), return_mode)
 
     async def _cleanup_wizard_messages(self, guild: discord.Guild, draft: EventDraft):
         """Best-effort cleanup of wizard messages in the draft channel."""
+        # A refresh firing after cleanup would re-send the deleted preview.
+        self._forget_draft_caches(draft.event_id)
+        # Detach the draft up front, so a refresh already past its debounce
+        # sees it as closed rather than re-sending the preview deleted below.
+        if self._drafts.get(draft.creator_id) is draft:
+            del self._drafts[draft.creator_id]
         try:
             if not draft.draft_channel_id:
                 return
@@ -1384,22 +1923,55 @@ class DiscoOps(commands.Cog):
 
             for mid in ids:
                 try:
-                    msg = await ch.fetch_message(mid)
-                    await msg.delete()
+                    await ch.get_partial_message(mid).delete()
                 except Exception:
                     pass
         except Exception:
             pass
 
+    @staticmethod
+    async def _delete_messages_by_id(channel, message_ids: List[int]) -> int:
+        """Delete messages by id without fetching them first.
+
+        Messages younger than 14 days go through the bulk-delete endpoint
+        (up to 100 per request). Older ones, or any batch the bulk call
+        rejects (e.g. no Manage Messages), fall back to single deletes.
+
+        Returns how many ids were cleared without an error. Bulk deletes
+        don't report ids that were already gone, so this is not an exact
+        count of messages removed.
+        """
+        cutoff = discord.utils.time_snowflake(datetime.now(timezone.utc) - timedelta(days=14))
+        recent = [mid for mid in message_ids if mid > cutoff]
+        single = [mid for mid in message_ids if mid <= cutoff]
+        deleted = 0
+
+        for i in range(0, len(recent), 100):
+            batch = recent[i:i + 100]
+            if len(batch) < 2:
+                single.extend(batch)
+                continue
+            try:
+                await channel.delete_messages([discord.Object(id=mid) for mid in batch])
+                deleted += len(batch)
+            except (discord.Forbidden, discord.HTTPException):
+                single.extend(batch)
+
+        for mid in single:
+            try:
+                await channel.get_partial_message(mid).delete()
+                deleted += 1
+            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                continue
+        return deleted
+
     async def _find_existing_post_for_scheduled(self, guild: discord.Guild, scheduled_event_id: int) -> Optional[dict]:
         try:
             posts = await self.config.guild(guild).event_posts()
-            for _eid, post in (posts or {}).items():
-                try:
-                    if int(post.get("linked_scheduled_event_id") or 0) == int(scheduled_event_id):
-                        return post
-                except Exception:
-                    continue
+            # IDs are stored as ints (see _coerce_post_ids), so compare directly.
+            for post in (posts or {}).values():
+                if post.get("linked_scheduled_event_id") == scheduled_event_id:
+                    return post
         except Exception:
             pass
         return None
@@ -1422,49 +1994,64 @@ class DiscoOps(commands.Cog):
                 ch_id = existing.get("channel_id")
                 msg_id = existing.get("message_id")
                 jump = ""
-                try:
-                    if ch_id and msg_id:
-                        jump = f"https://discord.com/channels/{guild.id}/{int(ch_id)}/{int(msg_id)}"
-                except Exception:
-                    jump = ""
+                if ch_id and msg_id:
+                    jump = f"https://discord.com/channels/{guild.id}/{ch_id}/{msg_id}"
                 msg = "An event post already exists for that scheduled event."
                 if jump:
                     msg += f"\n\nExisting post: {jump}"
                 return await self._send_ephemeral(interaction, msg)
 
+        # Only the claim is serialized; the posting and cleanup below run
+        # unlocked, and a second click sees the claim and backs off.
         async with self._draft_lock(draft.event_id):
-            try:
-                detailed_msg = await self._post_canonical_event(guild, draft, channel_hint=channel_id)
-            except (discord.Forbidden, discord.HTTPException, RuntimeError) as e:
-                await self.log_info(f"publish failed: user={interaction.user.id} guild={guild.id} channel={channel_id} err={e!r}")
-                return await self._send_ephemeral(
-                    interaction,
-                    "Publishing failed — I couldn't post in that channel. Check my permissions there and try again.",
-                )
+            if draft.status != "DRAFT":
+                return await self._send_ephemeral(interaction, "This draft is already being published.")
+            draft.status = "PUBLISHING"
 
-            # Optional: sync key fields back to calendar if linked & toggle is on
-            if draft.sync_back_to_calendar and draft.calendar_mode == "LINK_EXISTING" and draft.linked_scheduled_event_id:
-                try:
-                    cal = await self._resolve_scheduled_event(guild, draft.linked_scheduled_event_id)
-                    if cal:
-                        await cal.edit(
-                            name=draft.title or cal.name,
-                            start_time=draft.starts_at or cal.start_time,
-                            end_time=draft.ends_at or cal.end_time,
-                            description=(draft.description_md[:1000] or None),
-                        )
-                except Exception:
-                    pass
-
-            # Cleanup wizard messages
-            await self._cleanup_wizard_messages(guild, draft)
+        try:
+            detailed_msg = await self._post_canonical_event(guild, draft, channel=target)
+        except (discord.Forbidden, discord.HTTPException, RuntimeError) as e:
+            draft.status = "DRAFT"
+            await self.log_info(f"publish failed: user={interaction.user.id} guild={guild.id} channel={channel_id} err={e!r}")
+            return await self._send_ephemeral(
+                interaction,
+                "Publishing failed — I couldn't post in that channel. Check my permissions there and try again.",
+            )
+        except BaseException:
+            # Anything else (config errors, cancellation) must not leave the
+            # draft claimed forever.
+            draft.status = "DRAFT"
+            raise
+
+        # Cleanup wizard messages and (optionally) sync key fields back to
+        # the calendar. They touch unrelated endpoints, so run them together.
+        tasks = [self._cleanup_wizard_messages(guild, draft)]
+        if draft.sync_back_to_calendar and draft.calendar_mode == "LINK_EXISTING" and draft.linked_scheduled_event_id:
+            tasks.append(self._safe_cal_edit(guild, draft))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Cleanup transient draft
+        self._drafts.pop(draft.creator_id, None)
+        draft.status = "PUBLISHED"
 
-            # Cleanup transient draft
-            self._drafts.pop(draft.creator_id, None)
-            draft.status = "PUBLISHED"
+        await self._send_ephemeral(interaction, f"Event published. Jump: {detailed_msg.jump_url}")
+        await self.log_info(f"{interaction.user} published event {draft.event_id} in guild {guild.id}")
 
-            await self._send_ephemeral(interaction, f"Event published. Jump: {detailed_msg.jump_url}")
-            await self.log_info(f"{interaction.user} published event {draft.event_id} in guild {guild.id}")
+    async def _safe_cal_edit(self, guild: discord.Guild, draft: EventDraft):
+        """Best-effort push of draft fields to the linked scheduled event."""
+        try:
+            cal = await self._resolve_scheduled_event(guild, draft.linked_scheduled_event_id)
+            if cal:
+                await cal.edit(
+                    name=draft.title or cal.name,
+                    start_time=draft.starts_at or cal.start_time,
+                    end_time=draft.ends_at or cal.end_time,
+                    description=(draft.description_md[:1000] or None),
+                )
+                # Don't serve the pre-edit event from cache until the gateway update lands.
+                self._invalidate_events(guild.id)
+        except Exception:
+            pass
 
     async def _cancel_draft(self, interaction: discord.Interaction, draft: EventDraft):
         """Cancel and delete the draft."""
@@ -1473,9 +2060,21 @@ class DiscoOps(commands.Cog):
         await self._send_ephemeral(interaction, "Draft canceled.")
         await self.log_info(f"{interaction.user} canceled draft {draft.event_id} in guild {interaction.guild.id}")
 
-    async def _post_canonical_event(self, guild: discord.Guild, draft: EventDraft, channel_hint: Optional[int] = None) -> discord.Message:
-        """Post the final published event message."""
-        channel = guild.get_channel(channel_hint) if channel_hint else None
+    async def _post_canonical_event(
+        self,
+        guild: discord.Guild,
+        draft: EventDraft,
+        channel_hint: Optional[int] = None,
+        *,
+        channel: Optional[discord.abc.GuildChannel] = None,
+    ) -> discord.Message:
+        """Post the final published event message.
+
+        Callers that already resolved the destination pass it as `channel`;
+        the text_channels fallback (a sorted rebuild) only runs without one.
+        """
+        if channel is None and channel_hint:
+            channel = guild.get_channel(channel_hint)
         if channel is None:
             channel = next(iter(guild.text_channels), None)
         if channel is None:
@@ -1487,45 +2086,40 @@ class DiscoOps(commands.Cog):
             "starts_at_ts": int(draft.starts_at.timestamp()) if draft.starts_at else None,
             "ends_at_ts": int(draft.ends_at.timestamp()) if draft.ends_at else None,
             "comms": list(draft.comms or []),
-            "description_md": draft.description_md or "",
             "image_url": draft.image_url,
-            "linked_scheduled_event_id": draft.linked_scheduled_event_id,
+            "linked_scheduled_event_id": int(draft.linked_scheduled_event_id) if draft.linked_scheduled_event_id else None,
             "roles": {rid: self._role_to_dict(r) for rid, r in (draft.roles or {}).items()},
             "interested": [],
             "signups": {},
         }
 
         content = self._build_public_markdown(post)
+        self._drop_public_views(draft.event_id)  # a new post replaces any earlier one
         view = self._build_public_view(event_id=draft.event_id, disabled=False)
-        msg = await channel.send(content=content, view=view, allowed_mentions=discord.AllowedMentions.none())
+        msg = await channel.send(content=content, view=view, allowed_mentions=NO_MENTIONS)
 
-        # Store for later updates
+        # Store for later updates (snowflakes are already ints)
         post["channel_id"] = channel.id
         post["message_id"] = msg.id
         async with self.config.guild(guild).event_posts() as posts:
             posts[str(draft.event_id)] = post
+        async with self.config.guild(guild).event_posts_index() as index:
+            index[str(msg.id)] = str(draft.event_id)
+        if draft.description_md:
+            async with self.config.guild(guild).event_posts_desc() as descs:
+                descs[str(draft.event_id)] = draft.description_md
 
         # Long description as follow-ups (no buttons)
         desc = (draft.description_md or "").strip()
         detail_ids: List[int] = []
         if desc:
-            # Keep it markdown, but split for safety
-            chunks, cur = [], ""
-            for ln in desc.splitlines() or [desc]:
-                nxt = (cur + ("\n" if cur else "") + ln)
-                if len(nxt) > MAX_MSG:
-                    if cur:
-                        chunks.append(cur)
-                    cur = ln
-                else:
-                    cur = nxt
-            if cur:
-                chunks.append(cur)
-            for i, chnk in enumerate(chunks[:5], start=1):
+            # Keep it markdown, but split for safety; chunks are produced
+            # lazily so each send starts as soon as its text is ready.
+            for i, chnk in enumerate(islice(self._split_markdown(desc), 5), start=1):
                 header = f"## Details" if i == 1 else "## Details (continued)"
                 dmsg = await channel.send(
                     f"{header}\n{chnk}"[:MAX_MSG],
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    allowed_mentions=NO_MENTIONS,
                 )
                 try:
                     detail_ids.append(dmsg.id)
@@ -1550,37 +2144,25 @@ class DiscoOps(commands.Cog):
         return msg
 
     def _build_public_view(self, *, event_id: str, disabled: bool = False) -> discord.ui.View:
-        """Build the public view for a published event."""
-        class PublicView(discord.ui.View):
-            def __init__(self, is_disabled: bool):
-                super().__init__(timeout=None)
-                self.add_item(
-                    discord.ui.Button(
-                        label="Interested",
-                        style=discord.ButtonStyle.primary,
-                        custom_id=outer._public_view_custom_id("interest", str(event_id)),
-                        disabled=is_disabled,
-                    )
-                )
-                self.add_item(
-                    discord.ui.Button(
-                        label="Sign Up / Manage Role",
-                        style=discord.ButtonStyle.success,
-                        custom_id=outer._public_view_custom_id("signup", str(event_id)),
-                        disabled=is_disabled,
-                    )
-                )
-                self.add_item(
-                    discord.ui.Button(
-                        label="View Details",
-                        style=discord.ButtonStyle.secondary,
-                        custom_id=outer._public_view_custom_id("view", str(event_id)),
-                        disabled=is_disabled,
-                    )
-                )
+        """Build (once per event) the public view for a published event.
 
-        outer = self
-        return PublicView(disabled)
+        Buttons carry no per-click state and are routed by on_interaction,
+        so every interest/signup refresh can resend the same instance.
+        """
+        key = (str(event_id), disabled)
+        view = self._public_views.get(key)
+        if view is None:
+            view = self._public_views[key] = PublicView(self, key[0], disabled)
+            if len(self._public_views) > PUBLIC_VIEW_CACHE_MAX:
+                self._public_views.popitem(last=False)
+        else:
+            self._public_views.move_to_end(key)
+        return view
+
+    def _drop_public_views(self, event_id: str):
+        """Forget cached views for a post that was replaced or no longer exists."""
+        for disabled in (False, True):
+            self._public_views.pop((str(event_id), disabled), None)
 
     @commands.Cog.listener()
     async def on_interaction(self, interaction: discord.Interaction):
@@ -1594,21 +2176,17 @@ class DiscoOps(commands.Cog):
                 return
             if not custom_id.startswith("evtpub:"):
                 return
-            parts = custom_id.split(":")
-            if len(parts) < 3:
+            _, _, rest = custom_id.partition(":")
+            action, sep, event_id = rest.partition(":")
+            if not sep:
                 return
-            action = parts[1]
-            event_id = ":".join(parts[2:])
 
             if not interaction.guild:
                 return await self._send_ephemeral(interaction, "This can only be used in a server.")
 
-            if action == "interest":
-                await self._handle_public_interest(interaction, event_id)
-            elif action == "signup":
-                await self._handle_public_signup(interaction, event_id)
-            elif action == "view":
-                await self._handle_public_view_details(interaction, event_id)
+            handler = self._pub_actions.get(action)
+            if handler:
+                await handler(interaction, event_id)
         except Exception:
             # Never let interaction routing crash the cog
             pass
@@ -1622,16 +2200,15 @@ class DiscoOps(commands.Cog):
             post = posts.get(str(event_id))
             if not post:
                 return await self._send_ephemeral(interaction, "This event post is no longer tracked.")
+            # `post` is the live dict inside `posts`; Config persists in-place
+            # mutations when the context manager exits.
             interested = post.get("interested") or []
+            post["interested"] = interested
             if uid in interested:
-                interested = [i for i in interested if i != uid]
-                post["interested"] = interested
-                posts[str(event_id)] = post
+                interested[:] = [i for i in interested if i != uid]
                 await self._send_ephemeral(interaction, "You are no longer marked as interested.")
             else:
                 interested.append(uid)
-                post["interested"] = interested
-                posts[str(event_id)] = post
                 await self._send_ephemeral(interaction, "Marked you as interested.")
 
         await self._update_published_post_message(guild, event_id)
@@ -1655,8 +2232,6 @@ class DiscoOps(commands.Cog):
                 "This event has too many roles to show in the signup menu (max: 24). Ask an organizer to reduce the role list.",
             )
 
-        outer = self
-
         # Build options
         withdraw_value = "__withdraw__"
         options = [discord.SelectOption(label="Withdraw / No role", value=withdraw_value, description="Remove your signup")]
@@ -1666,27 +2241,12 @@ class DiscoOps(commands.Cog):
             except Exception:
                 continue
             cap = "∞" if r.capacity is None else str(r.capacity)
-            base = self._role_display_name(r)
-            label = f"{r.emoji} {base}" if r.emoji else base
+            label = self._role_label(r)
             desc = f"Cap: {cap}" + (f" • {r.description}" if r.description else "")
             options.append(discord.SelectOption(label=label[:100], value=str(rid), description=desc[:100]))
 
-        class SignupView(discord.ui.View):
-            def __init__(self):
-                super().__init__(timeout=120)
-
-            @discord.ui.select(placeholder="Pick your role…", options=options, min_values=1, max_values=1)
-            async def select_role(self, inter: discord.Interaction, select: discord.ui.Select):
-                if inter.user.id != interaction.user.id:
-                    return await inter.response.send_message("This menu is only for you.", ephemeral=True)
-                chosen = select.values[0]
-                await outer._apply_signup_choice(inter, event_id=str(event_id), role_id=str(chosen))
-                try:
-                    self.stop()
-                except Exception:
-                    pass
-
-        await self._send_ephemeral(interaction, "Choose a role:", view=SignupView())
+        view = SignupView(self, str(event_id), interaction.user.id, options)
+        await self._send_ephemeral(interaction, "Choose a role:", view=view)
 
     async def _apply_signup_choice(self, interaction: discord.Interaction, *, event_id: str, role_id: str):
         guild = interaction.guild
@@ -1702,6 +2262,7 @@ class DiscoOps(commands.Cog):
                 return await self._send_ephemeral(interaction, "This event post is no longer tracked.")
             roles = post.get("roles") or {}
             signups = post.get("signups") or {}
+            post["signups"] = signups
 
             prev = str(signups.get(uid_str) or "")
 
@@ -1723,15 +2284,10 @@ class DiscoOps(commands.Cog):
 
             # Apply
             if is_withdraw or not role_id:
-                if uid_str in signups:
-                    del signups[uid_str]
-                post["signups"] = signups
-                posts[str(event_id)] = post
+                signups.pop(uid_str, None)
                 await self._send_ephemeral(interaction, "Signup removed.")
             else:
                 signups[uid_str] = str(role_id)
-                post["signups"] = signups
-                posts[str(event_id)] = post
 
                 rd = roles.get(str(role_id)) or {}
                 r = self._role_from_dict(rd)
@@ -1747,7 +2303,10 @@ class DiscoOps(commands.Cog):
         if not post:
             return await self._send_ephemeral(interaction, "This event post is no longer tracked.")
         title = post.get("title") or "Untitled Event"
-        desc = (post.get("description_md") or "").strip()
+        # Read just this post's entry; a post cog_load couldn't migrate may
+        # still carry description_md inline.
+        stored = await self.config.guild(guild).event_posts_desc.get_raw(str(event_id), default=None)
+        desc = (stored or post.get("description_md") or "").strip()
         if not desc:
             desc = "*No details provided.*"
         # Ephemeral also has message limits; show a safe slice.
@@ -2047,7 +2606,7 @@ class DiscoOps(commands.Cog):
 
     async def _open_hub(self, ctx: commands.Context):
         content, view = await self._build_hub(ctx.guild, ctx.author.id, "main", prefix=ctx.clean_prefix)
-        await ctx.send(content, view=view, allowed_mentions=discord.AllowedMentions.none())
+        await ctx.send(content, view=view, allowed_mentions=NO_MENTIONS)
         await self.log_info(f"{ctx.author} opened the hub in guild {ctx.guild.id}")
 
     async def _build_hub(self, guild: discord.Guild, invoker_id: int, mode: str, prefix: str = "[p]"):
@@ -2410,7 +2969,7 @@ class DiscoOps(commands.Cog):
         if period_l not in ("days", "day", "weeks", "week", "months", "month"):
             await dest.send(
                 "Period must be 'days', 'weeks', or 'months'",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info("Invalid period provided to 'members new'")
             return
@@ -2424,62 +2983,56 @@ class DiscoOps(commands.Cog):
 
         cutoff_date = datetime.now(timezone.utc) - delta
 
-        # Access members (requires Server Members Intent); chunking a large
-        # guild can take a while, so show a typing indicator meanwhile.
-        try:
-            async with dest.typing():
-                members = list(guild.members)
-                if not members:
-                    try:
-                        await guild.chunk()
-                        members = list(guild.members)
-                    except discord.HTTPException:
-                        # Chunking failed, continue with empty list
-                        pass
-        except AttributeError as e:
-            # Programming error - guild.members not available
-            members = []
-            await self.log_info(f"AttributeError accessing guild members: {e}")
-        except discord.Forbidden as e:
-            # Permission error - missing Server Members Intent
-            members = []
-            await self.log_info(f"Forbidden error accessing guild members: {e}")
-
-        if not members:
-            await dest.send(
-                "I couldn't access the member list. Ensure **Server Members Intent** is enabled and the bot has cached members.",
-                allowed_mentions=discord.AllowedMentions.none(),
-            )
-            await self.log_info("members list empty or inaccessible; likely missing Server Members Intent")
-            return
+        cached = self._joined_index.get(guild.id)
+        if cached is None or time.monotonic() - cached[0] >= JOINED_INDEX_TTL:
+            # Access members (requires Server Members Intent); chunking a large
+            # guild can take a while, so show a typing indicator meanwhile.
+            try:
+                async with dest.typing():
+                    await self._ensure_chunked(guild)
+                    members = list(guild.members)
+            except AttributeError as e:
+                # Programming error - guild.members not available
+                members = []
+                await self.log_info(f"AttributeError accessing guild members: {e}")
+            except discord.Forbidden as e:
+                # Permission error - missing Server Members Intent
+                members = []
+                await self.log_info(f"Forbidden error accessing guild members: {e}")
 
-        # Filter recent members, handle tz-awareness defensively
-        try:
-            recent = []
-            for m in members:
-                ja = getattr(m, "joined_at", None)
-                if not ja:
-                    continue
-                if ja.tzinfo is None:
-                    ja = ja.replace(tzinfo=timezone.utc)
-                if ja > cutoff_date:
-                    recent.append((m, ja))
-        except Exception as e:
-            await self.log_info(f"Error filtering recent members: {e}")
-            await dest.send(
-                "An error occurred while reading member join dates.",
-                allowed_mentions=discord.AllowedMentions.none(),
-            )
-            return
+            if not members:
+                await dest.send(
+                    "I couldn't access the member list. Ensure **Server Members Intent** is enabled and the bot has cached members.",
+                    allowed_mentions=NO_MENTIONS,
+                )
+                await self.log_info("members list empty or inaccessible; likely missing Server Members Intent")
+                return
+
+            try:
+                cached = self._build_joined_index(guild.id, members)
+            except Exception as e:
+                await self.log_info(f"Error filtering recent members: {e}")
+                await dest.send(
+                    "An error occurred while reading member join dates.",
+                    allowed_mentions=NO_MENTIONS,
+                )
+                return
 
-        recent.sort(key=lambda tup: tup[1], reverse=True)
+        # Members are sorted by join time: binary-search the cutoff, newest first.
+        _built, stamps, ids = cached
+        start = bisect_right(stamps, cutoff_date.timestamp())
+        recent = []
+        for i in range(len(stamps) - 1, start - 1, -1):
+            member = guild.get_member(ids[i])
+            if member is not None:
+                recent.append((member, stamps[i]))
 
         if not recent:
             await dest.send(
                 f"ℹ️ No members joined in the last {amount} {period_l}.\n\n"
                 f"**Note:** Make sure the bot has been running and has cached member data. "
                 f"Members who joined before the bot was added won't be tracked.",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info("No recent members found")
             return
@@ -2487,8 +3040,8 @@ class DiscoOps(commands.Cog):
         # Build plain markdown sections and paginate
         header = f"# New Members\n**Range:** last **{amount} {period_l}**  •  **Found:** {len(recent)}"
         sections = []
-        for (member, ja) in recent:
-            epoch = int(ja.timestamp())
+        for (member, joined_ts) in recent:
+            epoch = int(joined_ts)
             block = (
                 f"## {member.display_name}\n"
                 f"> **Member**: {member.mention} ({member.display_name})\n"
@@ -2500,6 +3053,43 @@ class DiscoOps(commands.Cog):
         await self._send_paginated(dest, sections, header=header)
         await self.log_info(f"Sent recent members list ({len(recent)} found)")
 
+    def _build_joined_index(self, guild_id: int, members) -> Tuple[float, List[float], List[int]]:
+        """Sort members by join time (naive datetimes read as UTC) and cache the result."""
+        pairs = []
+        for m in members:
+            ja = getattr(m, "joined_at", None)
+            if not ja:
+                continue
+            if ja.tzinfo is None:
+                ja = ja.replace(tzinfo=timezone.utc)
+            pairs.append((ja.timestamp(), m.id))
+        pairs.sort()
+        entry = (time.monotonic(), [ts for ts, _ in pairs], [mid for _, mid in pairs])
+        self._joined_index[guild_id] = entry
+        return entry
+
+    @staticmethod
+    async def _ensure_chunked(guild: discord.Guild) -> None:
+        """Request the full member list once so role.members/get_member are complete.
+
+        Needs the Server Members intent; on failure or timeout the member
+        cache is used as it is.
+        """
+        if getattr(guild, "chunked", True):
+            return
+        try:
+            await asyncio.wait_for(guild.chunk(cache=True), MEMBER_CHUNK_TIMEOUT)
+        except (asyncio.TimeoutError, discord.ClientException, discord.HTTPException):
+            pass
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self._joined_index.pop(member.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self._joined_index.pop(member.guild.id, None)
+
     @members_group.command(name="role")
     async def members_role(self, ctx, *, role: discord.Role):
         """List all members with a specific role and show count."""
@@ -2507,32 +3097,38 @@ class DiscoOps(commands.Cog):
         await self._members_role_report(ctx, role)
 
     async def _members_role_report(self, dest, role: discord.Role):
-        """Core report for members holding a role; `dest` needs .send."""
+        """Core report for members holding a role; `dest` needs .send and .typing."""
+        # Chunking a large guild can take a while; show feedback meanwhile.
+        async with dest.typing():
+            await self._ensure_chunked(role.guild)
         members_with_role = role.members
 
         header = f"# Members with role\n**Role:** `{role.name}`  •  **Total:** {len(members_with_role)}"
-        sections = []
 
-        if not members_with_role:
-            sections.append("## Members\n> None")
-        else:
-            # Chunk the member list into readable blocks
-            chunk_size = 20
-            for i in range(0, len(members_with_role), chunk_size):
-                chunk = members_with_role[i:i + chunk_size]
-                lines = [f"{i+j+1}. {m.mention} ({m.display_name})" for j, m in enumerate(chunk)]
-                sections.append(f"## Members {i+1}-{i+len(chunk)}\n" + "\n".join(lines))
-
-        role_info = (
-            f"## Role Info\n"
-            f"> **Created**: {role.created_at.strftime('%Y-%m-%d')}\n"
-            f"> **Position**: {role.position}\n"
-            f"> **Mentionable**: {'Yes' if role.mentionable else 'No'}\n"
-            f"> **Color**: {str(role.color)}"
-        )
-        sections.append(role_info)
+        def gen_sections():
+            if not members_with_role:
+                yield "## Members\n> None"
+            else:
+                # Same streaming shape as event info: format 20 members at a
+                # time with islice, so pages go out as they fill.
+                lines = (f"{idx}. {m.mention} ({m.display_name})" for idx, m in enumerate(members_with_role, 1))
+                start = 1
+                while True:
+                    batch = list(islice(lines, 20))
+                    if not batch:
+                        break
+                    yield f"## Members {start}-{start + len(batch) - 1}\n" + "\n".join(batch)
+                    start += len(batch)
+
+            yield (
+                f"## Role Info\n"
+                f"> **Created**: {role.created_at.strftime('%Y-%m-%d')}\n"
+                f"> **Position**: {role.position}\n"
+                f"> **Mentionable**: {'Yes' if role.mentionable else 'No'}\n"
+                f"> **Color**: {str(role.color)}"
+            )
 
-        await self._send_paginated(dest, sections, header=header)
+        await self._send_paginated(dest, gen_sections(), header=header)
         await self.log_info(f"Sent members-with-role list ({len(members_with_role)} members)")
 
     # ========== Activity Commands ==========
@@ -2579,7 +3175,7 @@ class DiscoOps(commands.Cog):
                 self._voice_joined.pop(key, None)
         await ctx.send(
             f"Activity tracking is now **{'ON' if new_val else 'OFF'}** for this server.",
-            allowed_mentions=discord.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
         )
         await self.log_info(f"{ctx.author} set activity tracking to {new_val} in guild {ctx.guild.id}")
 
@@ -2628,130 +3224,101 @@ class DiscoOps(commands.Cog):
         posts = await self.config.guild(ctx.guild).event_posts()
         posts = posts or {}
         header = f"# Wizard Events\n**Tracked:** {len(posts)}"
-        sections = []
         if not posts:
-            sections.append("## Events\n> None")
+            sections = ["## Events\n> None"]
         else:
-            for event_id, post in posts.items():
-                title = (post.get("title") or "Untitled").strip()
-                ch_id = post.get("channel_id")
-                msg_id = post.get("message_id")
-                linked = post.get("linked_scheduled_event_id")
-                interested = len(post.get("interested") or [])
-                signups = len(post.get("signups") or {})
-                jump = ""
-                try:
-                    if ch_id and msg_id:
-                        jump = f"https://discord.com/channels/{ctx.guild.id}/{int(ch_id)}/{int(msg_id)}"
-                except Exception:
-                    jump = ""
+            sections = [self._wizard_post_section(ctx.guild, eid, post) for eid, post in posts.items()]
+        await self._send_paginated(ctx, sections, header=header)
 
-                ch_mention = "(missing channel)"
-                try:
-                    ch = ctx.guild.get_channel(int(ch_id)) if ch_id else None
-                    if ch:
-                        ch_mention = ch.mention
-                except Exception:
-                    pass
+    @staticmethod
+    def _wizard_post_section(guild: discord.Guild, event_id: str, post: dict) -> str:
+        """Render one tracked wizard post for `event wizard list`.
 
-                sec = (
-                    f"## {title}\n"
-                    f"> **Wizard ID**: `{event_id}`\n"
-                    f"> **Channel**: {ch_mention}\n"
-                    + (f"> **Jump**: {jump}\n" if jump else "")
-                    + (f"> **Linked Scheduled Event ID**: `{linked}`\n" if linked else "")
-                    + f"> **Interested**: {interested}  •  **Signups**: {signups}"
-                )
-                sections.append(sec)
-        await self._send_paginated(ctx, sections, header=header)
+        Channel/message IDs are written as ints at publish time, so no
+        coercion is needed here.
+        """
+        title = (post.get("title") or "Untitled").strip()
+        ch_id = post.get("channel_id")
+        msg_id = post.get("message_id")
+        linked = post.get("linked_scheduled_event_id")
+        ch = guild.get_channel(ch_id) if ch_id else None
+        lines = [
+            f"## {title}",
+            f"> **Wizard ID**: `{event_id}`",
+            f"> **Channel**: {ch.mention if ch else '(missing channel)'}",
+        ]
+        if ch_id and msg_id:
+            lines.append(f"> **Jump**: https://discord.com/channels/{guild.id}/{ch_id}/{msg_id}")
+        if linked:
+            lines.append(f"> **Linked Scheduled Event ID**: `{linked}`")
+        lines.append(
+            f"> **Interested**: {len(post.get('interested') or [])}  •  **Signups**: {len(post.get('signups') or {})}"
+        )
+        return "\n".join(lines)
 
     @event_wizard_group.command(name="delete")
     async def event_wizard_delete(self, ctx: commands.Context, *, identifier: str):
         """Delete a published wizard event (by wizard ID or message link/id)."""
         identifier = (identifier or "").strip()
         if not identifier:
-            return await ctx.send("Provide a wizard event id or message link.", allowed_mentions=discord.AllowedMentions.none())
-
-        posts = await self.config.guild(ctx.guild).event_posts()
-        posts = posts or {}
+            return await ctx.send("Provide a wizard event id or message link.", allowed_mentions=NO_MENTIONS)
 
-        target_event_id = None
-
-        # Parse message link
+        # Message id from a link (the last id in it) or a bare id.
+        lookup_mid = None
         if "/channels/" in identifier:
-            try:
-                parts = identifier.replace("<", "").replace(">", "").split("/")
-                msg_id = None
-                for tok in reversed(parts):
-                    if tok.isdigit():
-                        msg_id = int(tok)
-                        break
-                if msg_id:
-                    for eid, post in posts.items():
-                        if int(post.get("message_id") or 0) == msg_id:
-                            target_event_id = eid
-                            break
-            except Exception:
-                pass
-
-        # Parse bare message id
-        if target_event_id is None and identifier.isdigit():
-            mid = int(identifier)
-            for eid, post in posts.items():
-                try:
-                    if int(post.get("message_id") or 0) == mid:
-                        target_event_id = eid
-                        break
-                except Exception:
-                    continue
-
-        # Fallback: treat as wizard id
-        if target_event_id is None:
-            if identifier in posts:
+            ids = SNOWFLAKE_RE.findall(identifier)
+            if ids:
+                lookup_mid = ids[-1]
+        elif identifier.isdigit():
+            lookup_mid = identifier
+
+        # The post, its index entry and its description change together, in
+        # one block (fixed order: posts -> index -> desc). Message deletion
+        # happens afterwards so clicks on other posts aren't held behind REST.
+        gconf = self.config.guild(ctx.guild)
+        async with gconf.event_posts() as posts_mut, \
+                gconf.event_posts_index() as index_mut, \
+                gconf.event_posts_desc() as descs:
+            target_event_id = index_mut.get(lookup_mid) if lookup_mid else None
+            # Fallback: treat as wizard id
+            if target_event_id is None and identifier in posts_mut:
                 target_event_id = identifier
+            post = posts_mut.pop(str(target_event_id), None) if target_event_id else None
+            if post is None:
+                # An index entry pointing at a missing post is stale; drop it.
+                if lookup_mid:
+                    index_mut.pop(lookup_mid, None)
+            else:
+                if post.get("message_id"):
+                    index_mut.pop(str(post["message_id"]), None)
+                descs.pop(str(target_event_id), None)
 
-        if not target_event_id:
-            return await ctx.send("Wizard event not found.", allowed_mentions=discord.AllowedMentions.none())
-
-        post = posts.get(str(target_event_id))
         if not post:
-            return await ctx.send("Wizard event not found.", allowed_mentions=discord.AllowedMentions.none())
+            return await ctx.send("Wizard event not found.", allowed_mentions=NO_MENTIONS)
 
-        deleted = 0
+        cleared = 0
         ch_id = post.get("channel_id")
         msg_id = post.get("message_id")
         detail_ids = post.get("details_message_ids") or []
 
-        try:
-            ch = ctx.guild.get_channel(int(ch_id)) if ch_id else None
-        except Exception:
-            ch = None
-
-        if ch:
-            # Delete main message
-            try:
-                if msg_id:
-                    m = await ch.fetch_message(int(msg_id))
-                    await m.delete()
-                    deleted += 1
-            except Exception:
-                pass
-            # Delete detail messages
-            for did in detail_ids:
-                try:
-                    m2 = await ch.fetch_message(int(did))
-                    await m2.delete()
-                    deleted += 1
-                except Exception:
-                    continue
+        ch = ctx.guild.get_channel(ch_id) if ch_id else None
+        ids = [x for x in (msg_id, *detail_ids) if x]
+        if ch and ids:
+            cleared = await self._delete_messages_by_id(ch, ids)
 
-        async with self.config.guild(ctx.guild).event_posts() as posts_mut:
-            if str(target_event_id) in posts_mut:
-                del posts_mut[str(target_event_id)]
+        self._drop_public_views(target_event_id)
 
+        if not ids:
+            note = "It had no post messages on record."
+        elif cleared:
+            note = "Its post messages were cleaned up."
+        elif ch is None:
+            note = "Its post channel no longer exists, so there were no messages to remove."
+        else:
+            note = "I couldn't remove its post messages (check my Manage Messages permission there)."
         await ctx.send(
-            f"Deleted wizard event `{target_event_id}`. Messages removed: {deleted}",
-            allowed_mentions=discord.AllowedMentions.none(),
+            f"Deleted wizard event `{target_event_id}`. {note}",
+            allowed_mentions=NO_MENTIONS,
         )
 
     @event_wizard_group.group(name="divisions", invoke_without_command=True)
@@ -2773,36 +3340,44 @@ class DiscoOps(commands.Cog):
     async def event_wizard_divisions_add(self, ctx: commands.Context, *, name: str):
         name = (name or "").strip()
         if not name:
-            return await ctx.send("Division name required.", allowed_mentions=discord.AllowedMentions.none())
+            return await ctx.send("Division name required.", allowed_mentions=NO_MENTIONS)
         async with self.config.guild(ctx.guild).wizard_divisions() as vals:
             norm = self._norm_text(name)
-            if any(self._norm_text(v) == norm for v in (vals or [])):
-                return await ctx.send("That division already exists.", allowed_mentions=discord.AllowedMentions.none())
+            norms = self._division_norms.get(ctx.guild.id)
+            if norms is None:
+                norms = self._division_norms[ctx.guild.id] = {self._norm_text(v) for v in vals or []}
+            if norm in norms:
+                return await ctx.send("That division already exists.", allowed_mentions=NO_MENTIONS)
             vals.append(name)
-        await ctx.send(f"Added division: **{name}**", allowed_mentions=discord.AllowedMentions.none())
+            norms.add(norm)
+        await ctx.send(f"Added division: **{name}**", allowed_mentions=NO_MENTIONS)
 
     @event_wizard_divisions.command(name="remove", aliases=["rm", "del"])
     async def event_wizard_divisions_remove(self, ctx: commands.Context, *, name: str):
         name = (name or "").strip()
         if not name:
-            return await ctx.send("Division name required.", allowed_mentions=discord.AllowedMentions.none())
+            return await ctx.send("Division name required.", allowed_mentions=NO_MENTIONS)
         removed = False
         async with self.config.guild(ctx.guild).wizard_divisions() as vals:
             norm = self._norm_text(name)
-            new_vals = [v for v in (vals or []) if self._norm_text(v) != norm]
-            removed = len(new_vals) != len(vals or [])
-            vals.clear()
-            vals.extend(new_vals)
+            # Walk backwards so deleting doesn't shift the items still to visit.
+            for i in range(len(vals) - 1, -1, -1):
+                if self._norm_text(vals[i]) == norm:
+                    del vals[i]
+                    removed = True
+        if removed and ctx.guild.id in self._division_norms:
+            self._division_norms[ctx.guild.id].discard(norm)
         if removed:
-            await ctx.send(f"Removed division: **{name}**", allowed_mentions=discord.AllowedMentions.none())
+            await ctx.send(f"Removed division: **{name}**", allowed_mentions=NO_MENTIONS)
         else:
-            await ctx.send("Division not found.", allowed_mentions=discord.AllowedMentions.none())
+            await ctx.send("Division not found.", allowed_mentions=NO_MENTIONS)
 
     @event_wizard_divisions.command(name="reset")
     async def event_wizard_divisions_reset(self, ctx: commands.Context):
         defaults = ["Hugin", "Munin", "Faffne", "Fenrir", "Idun"]
         await self.config.guild(ctx.guild).wizard_divisions.set(defaults)
-        await ctx.send("Wizard divisions reset to defaults.", allowed_mentions=discord.AllowedMentions.none())
+        self._division_norms.pop(ctx.guild.id, None)
+        await ctx.send("Wizard divisions reset to defaults.", allowed_mentions=NO_MENTIONS)
 
     @event_group.command(name="list", aliases=["ls"])
     async def event_list(self, ctx):
@@ -2812,121 +3387,150 @@ class DiscoOps(commands.Cog):
 
     async def _event_list_report(self, dest, guild: discord.Guild):
         """Core scheduled-events listing; `dest` needs .send and .typing."""
+        # Start the fetch before the typing request so the two round-trips overlap.
+        fetch = asyncio.create_task(self._get_scheduled_events(guild, with_counts=True))
         async with dest.typing():
-            events = await self._get_scheduled_events(guild, with_counts=True)
+            events = await fetch
         if not events:
             await dest.send(
                 "No scheduled events found in this server.",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             return
 
+        # Sort a copy: `events` is the list shared through the events cache.
         far_future = datetime.max.replace(tzinfo=timezone.utc)
         try:
-            events.sort(key=lambda e: e.start_time or far_future)
+            events = sorted(events, key=lambda e: e.start_time or far_future)
         except Exception:
             pass
 
         header = f"# Scheduled Events\n**Total:** {len(events)}"
-        sections = []
-        for event in events:
-            name = getattr(event, "name", "Unnamed Event")
-            status = getattr(event.status, "name", "UNKNOWN").title() if getattr(event, "status", None) else "UNKNOWN"
-            user_count = getattr(event, "user_count", 0) or 0
-
-            st = getattr(event, "start_time", None)
-            if st:
-                if st.tzinfo is None:
-                    st = st.replace(tzinfo=timezone.utc)
-                epoch = int(st.timestamp())
-                start_line = f"<t:{epoch}:F> • <t:{epoch}:R> (unix: `{epoch}`)"
-            else:
-                start_line = "N/A"
-
-            desc = getattr(event, "description", None)
-            desc_block = ""
-            if desc:
-                short = desc if len(desc) <= 200 else desc[:200] + "..."
-                desc_block = "\n" + self._quote_lines(short)
-
-            location_line = ""
-            if getattr(event, "location", None):
-                location_line = f"\n> **Location**: {event.location}"
-            elif getattr(event, "channel", None):
-                try:
-                    location_line = f"\n> **Channel**: {event.channel.mention}"
-                except Exception:
-                    pass
 
-            section = (
-                f"## {name}\n"
-                f"> **Status**: {status}\n"
-                f"> **Start**: {start_line}\n"
-                f"> **Interested**: {user_count}"
-                f"{desc_block}"
-                f"{location_line}"
-            )
-            sections.append(section)
+        def gen_sections():
+            for event in events:
+                name = getattr(event, "name", "Unnamed Event")
+                status = _status_title(getattr(event.status, "name", "UNKNOWN")) if getattr(event, "status", None) else "UNKNOWN"
+                user_count = getattr(event, "user_count", 0) or 0
 
-        await self._send_paginated(dest, sections, header=header)
+                start_line = _start_line(getattr(event, "start_time", None))
+
+                desc = getattr(event, "description", None)
+                desc_block = ""
+                if desc:
+                    short = desc if len(desc) <= 200 else desc[:200] + "..."
+                    desc_block = "\n" + self._quote_lines(short)
+
+                location_line = ""
+                if getattr(event, "location", None):
+                    location_line = f"\n> **Location**: {event.location}"
+                elif getattr(event, "channel", None):
+                    try:
+                        location_line = f"\n> **Channel**: {event.channel.mention}"
+                    except Exception:
+                        pass
+
+                yield (
+                    f"## {name}\n"
+                    f"> **Status**: {status}\n"
+                    f"> **Start**: {start_line}\n"
+                    f"> **Interested**: {user_count}"
+                    f"{desc_block}"
+                    f"{location_line}"
+                )
+
+        await self._send_paginated(dest, gen_sections(), header=header)
 
     @event_group.command(name="members")  # deprecated path, kept for compatibility
     async def event_members_legacy(self, ctx, *, event_name: str):
         """[Deprecated] Use: `[p]do event "Name"` instead."""
         await ctx.send(
             "`members` is deprecated. Use: `[p]do event \"Event Name\"`.\nShowing the info below:",
-            allowed_mentions=discord.AllowedMentions.none(),
+            allowed_mentions=NO_MENTIONS,
         )
         await self._event_info_with_members(ctx, ctx.guild, event_name)
 
+    async def _fetch_interested_members(self, guild: discord.Guild, event) -> List[discord.Member]:
+        """Resolve a scheduled event's interested users to guild members.
+
+        Pages the event-users endpoint 100 at a time with `with_member=true`,
+        so members missing from the cache come back in-band instead of being
+        dropped. Falls back to `event.users()` + the member cache when the
+        HTTP helper or guild state is missing, or the raw fetch fails.
+        """
+        # Private path on purpose: the public `event.users()` iterator yields
+        # bare Users, so members missing from the cache (no members intent,
+        # not chunked yet) would be dropped. The raw endpoint with
+        # with_member=true carries their member payload in the same page.
+        getter = getattr(getattr(self.bot, "http", None), "get_scheduled_event_users", None)
+        state = getattr(guild, "_state", None)
+        if getter is not None and state is not None:
+            try:
+                members: List[discord.Member] = []
+                after = 0  # explicit: user ids page in ascending order after this cursor
+                while True:
+                    page = await getter(guild.id, event.id, 100, with_member=True, after=after)
+                    if not page:
+                        break
+                    last_id = 0
+                    for entry in page:
+                        user = entry.get("user") or {}
+                        uid = int(user.get("id") or 0)
+                        if uid > last_id:
+                            last_id = uid  # next page cursor, tracked in the same pass
+                        member = guild.get_member(uid)
+                        if member is None and entry.get("member"):
+                            try:
+                                member = discord.Member(data={**entry["member"], "user": user}, guild=guild, state=state)
+                            except Exception:
+                                member = None
+                        if member:
+                            members.append(member)
+                    if len(page) < 100:
+                        break
+                    after = last_id
+                return members
+            except Exception as e:
+                await self.log_info(f"interested users: raw fetch failed ({e!r}); using event.users()")
+        return [m async for u in event.users() if (m := guild.get_member(u.id))]
+
     async def _event_info_with_members(self, dest, guild: discord.Guild, event_name: str):
         """Show one event summary + interested members as plain messages (auto-paginated)."""
+        fetch = asyncio.create_task(self._get_scheduled_events(guild, with_counts=True))
         async with dest.typing():
-            events = await self._get_scheduled_events(guild, with_counts=True)
-            event = self._event_match(events, event_name)
+            events = await fetch
+            event = self._event_match(self._events_index_for(guild.id, events), event_name)
         if not event:
             await dest.send(
                 f"❌ **Event Not Found:** '{event_name}'\n\n"
                 f"**Tip:** Use `[p]do event list` to see all scheduled events, then copy the exact event name.\n"
                 f"**Note:** Event names are case-insensitive and support partial matches.",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info(f"event info: not found for query={event_name!r}")
             return
 
         # Collect users (paged HTTP calls; keep the typing indicator going)
-        interested_users = []
         try:
             async with dest.typing():
-                async for user in event.users():
-                    member = guild.get_member(user.id)
-                    if member:
-                        interested_users.append(member)
-        except Exception as e:
+                interested_users = await self._fetch_interested_members(guild, event)
+        except (discord.HTTPException, asyncio.TimeoutError) as e:
             await dest.send(
                 f"Error fetching interested users: {e}",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info(f"Error fetching users for event {getattr(event, 'id', 'unknown')}: {e}")
             return
 
-        status = getattr(event.status, "name", "UNKNOWN").title() if getattr(event, "status", None) else "UNKNOWN"
+        status = _status_title(getattr(event.status, "name", "UNKNOWN")) if getattr(event, "status", None) else "UNKNOWN"
 
-        st = getattr(event, "start_time", None)
-        if st:
-            if st.tzinfo is None:
-                st = st.replace(tzinfo=timezone.utc)
-            epoch = int(st.timestamp())
-            start_line = f"<t:{epoch}:F> • <t:{epoch}:R> (unix: `{epoch}`)"
-        else:
-            start_line = "N/A"
+        start_line = _start_line(getattr(event, "start_time", None))
 
         total_interested = len(interested_users)
         name = getattr(event, "name", "Unnamed Event")
         desc = getattr(event, "description", None)
 
         header = f"# {name}"
-        sections = []
 
         # Summary block (keep multi-line desc inside blockquote)
         desc_block = ""
@@ -2949,22 +3553,23 @@ class DiscoOps(commands.Cog):
             f"{desc_block}"
             f"{location_line}"
         )
-        sections.append(summary)
-
-        # Interested members (chunk into sections)
-        if total_interested:
-            lines = [f"{i}. {m.mention} ({m.display_name})" for i, m in enumerate(interested_users, start=1)]
-            chunk_size = 20
-            for idx in range(0, len(lines), chunk_size):
-                chunk = lines[idx:idx + chunk_size]
-                if idx == 0:
-                    sections.append(f"## Interested Members {total_interested}\n" + "\n".join(chunk))
-                else:
-                    sections.append("## Interested Members (continued)\n" + "\n".join(chunk))
-        else:
-            sections.append("## Interested Members 0\n> None")
 
-        await self._send_paginated(dest, sections, header=header)
+        def gen_sections():
+            yield summary
+            if not total_interested:
+                yield "## Interested Members 0\n> None"
+                return
+            # Format 20 members at a time; pages go out as they fill.
+            lines = (f"{i}. {m.mention} ({m.display_name})" for i, m in enumerate(interested_users, start=1))
+            heading = f"## Interested Members {total_interested}"
+            while True:
+                chunk = list(islice(lines, 20))
+                if not chunk:
+                    break
+                yield heading + "\n" + "\n".join(chunk)
+                heading = "## Interested Members (continued)"
+
+        await self._send_paginated(dest, gen_sections(), header=header)
         await self.log_info(f"event info viewed for {getattr(event, 'id', 'unknown')} in guild {guild.id}")
 
     @event_group.command(name="role")
@@ -2972,137 +3577,144 @@ class DiscoOps(commands.Cog):
         """
         Create, sync, or delete a role for event attendees.
 
-        Usage: [p]do event role <create|sync|delete> <event_name> [--ping]
+        Usage: [p]do event role <create|sync|delete> <event_name> [--ping] [--force]
 
         Notes:
         - Mentions are suppressed by default to prevent mass-pings.
-        - Add `--ping` to send a final message that pings the event role.
+        - Add `--ping` to let the result message (which names the role) ping it;
+          no separate ping message is sent.
+        - `sync` skips work when the interested count already equals the role's
+          member count; add `--force` to sync anyway.
         """
-        raw_event_name = event_name or ""
-        ping = False
-        if raw_event_name.endswith(" --ping"):
-            ping = True
-            event_name = raw_event_name[: -len(" --ping")].rstrip()
+        flags = set()
+        head, sep, tail = event_name.rpartition(" ")
+        while sep and tail in EVENT_ROLE_FLAGS:
+            flags.add(tail)
+            event_name = head.rstrip()
+            head, sep, tail = event_name.rpartition(" ")
+        ping = "--ping" in flags
+        force = "--force" in flags
 
         action_l = (action or "").lower()
         if action_l not in ("create", "sync", "delete"):
             await ctx.send(
                 "Action must be 'create', 'sync', or 'delete'",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             return
 
-        await self._event_role_action(ctx, ctx.guild, ctx.author, action_l, event_name, ping)
+        await self._event_role_action(ctx, ctx.guild, ctx.author, action_l, event_name, ping, force=force)
 
-    async def _event_role_action(self, dest, guild: discord.Guild, author, action_l: str, event_name: str, ping: bool):
+    async def _event_role_action(
+        self, dest, guild: discord.Guild, author, action_l: str, event_name: str, ping: bool, *, force: bool = False
+    ):
         """Create/sync/delete an attendee role for a scheduled event.
 
         `dest` needs .send and .typing; callable from prefix command or hub.
         """
+        fetch = asyncio.create_task(self._get_scheduled_events(guild, with_counts=True))
         async with dest.typing():
-            events = await self._get_scheduled_events(guild, with_counts=True)
-            event = self._event_match(events, event_name)
+            events = await fetch
+            event = self._event_match(self._events_index_for(guild.id, events), event_name)
         if not event:
             await dest.send(
                 f"❌ **Event Not Found:** '{event_name}'\n\n"
                 f"**Tip:** Use `[p]do event list` to see all scheduled events, then copy the exact event name.\n"
                 f"**Note:** Event names are case-insensitive and support partial matches.",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info(f"event role: not found for query={event_name!r}")
             return
 
+        event_roles = await self.config.guild(guild).event_roles()
+        event_id_str = str(getattr(event, "id", "0"))
+        event_label = getattr(event, "name", "Event")
+
+        # Sync diffs against role.members, which only covers cached members.
+        if action_l == "sync":
+            async with dest.typing():
+                await self._ensure_chunked(guild)
+
+        # Paging through event.users() is the expensive part of a sync. If the
+        # interested count already matches the role's size, assume nothing
+        # changed (a weak check: members may hold the role manually).
+        if action_l == "sync" and not force and event_id_str in event_roles:
+            role = guild.get_role(event_roles[event_id_str])
+            user_count = getattr(event, "user_count", None)
+            if role and user_count is not None and user_count == len(role.members):
+                await dest.send(
+                    f"{role.mention} already has {user_count} members, matching the interested count — nothing to sync.\n"
+                    f"Add `--force` to sync anyway.",
+                    allowed_mentions=NO_MENTIONS,
+                )
+                return
+
         # Interested users
-        interested_users = []
         try:
             async with dest.typing():
-                async for user in event.users():
-                    member = guild.get_member(user.id)
-                    if member:
-                        interested_users.append(member)
-        except Exception as e:
+                interested_users = await self._fetch_interested_members(guild, event)
+        except (discord.HTTPException, asyncio.TimeoutError) as e:
             await dest.send(
                 f"Error fetching interested users: {e}",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info(f"Error fetching users for event {getattr(event, 'id', 'unknown')}: {e}")
             return
 
-        event_roles = await self.config.guild(guild).event_roles()
-        event_id_str = str(getattr(event, "id", "0"))
-
         if action_l == "create":
             if event_id_str in event_roles:
                 role = guild.get_role(event_roles[event_id_str])
                 if role:
+                    # The status line carries the role mention, so --ping only
+                    # has to allow it rather than send a second message.
                     await dest.send(
                         f"Role already exists: {role.mention}",
-                        allowed_mentions=discord.AllowedMentions.none(),
+                        allowed_mentions=ROLE_PING_MENTIONS if ping else NO_MENTIONS,
                     )
-                    if ping:
-                        await dest.send(
-                            role.mention,
-                            allowed_mentions=discord.AllowedMentions(
-                                roles=True, users=False, everyone=False, replied_user=False
-                            ),
-                        )
                     return
             try:
                 role = await guild.create_role(
-                    name=f"Event: {getattr(event, 'name', 'Event')}",
+                    name=f"Event: {event_label}",
                     color=discord.Color.random(),
                     mentionable=True,
                     reason=f"Event role created by {author}"
                 )
-                async with self.config.guild(guild).event_roles() as roles:
-                    roles[event_id_str] = role.id
-                
-                # Check role hierarchy before attempting to assign
+
+                # Check role hierarchy before persisting or assigning anything
                 # Bot can only manage roles strictly below its highest role
-                if guild.me.top_role <= role:
-                    # Delete the unusable role
+                my_top = guild.me.top_role  # computed from the member's roles on each access
+                if my_top <= role:
+                    # Delete the unusable role (never written to config)
                     try:
                         await role.delete(reason="Role hierarchy issue - bot cannot manage this role")
                     except discord.Forbidden:
                         pass
-                    # Remove from config
-                    async with self.config.guild(guild).event_roles() as roles:
-                        if event_id_str in roles:
-                            del roles[event_id_str]
                     await dest.send(
                         f"❌ **Role Hierarchy Issue**\n"
                         f"The created role would be at or above my highest role, which prevents me from managing it.\n"
                         f"Role has been deleted.\n\n"
                         f"**To fix:** Go to Server Settings → Roles and drag my role higher, then try again.",
-                        allowed_mentions=discord.AllowedMentions.none(),
+                        allowed_mentions=NO_MENTIONS,
                     )
-                    await self.log_info(f"Role hierarchy issue: bot role {guild.me.top_role.name} below event role - deleted role")
+                    await self.log_info(f"Role hierarchy issue: bot role {my_top.name} below event role - deleted role")
                     return
-                
+
+                async with self.config.guild(guild).event_roles() as roles:
+                    roles[event_id_str] = role.id
+
                 if len(interested_users) > 10:
                     await dest.send(
                         f"Assigning {role.mention} to {len(interested_users)} interested members — this can take a while (Discord rate limits)…",
-                        allowed_mentions=discord.AllowedMentions.none(),
+                        allowed_mentions=NO_MENTIONS,
                     )
-                added = 0
                 async with dest.typing():
-                    for member in interested_users:
-                        try:
-                            await member.add_roles(role, reason=f"Event role created by {author}")
-                            added += 1
-                        except discord.Forbidden:
-                            pass
+                    added, _ = await self._bulk_role_edit(
+                        role, add=interested_users, reason=f"Event role created by {author}"
+                    )
                 await dest.send(
                     f"Created role {role.mention} and added to {added} interested members",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    allowed_mentions=ROLE_PING_MENTIONS if ping else NO_MENTIONS,
                 )
-                if ping:
-                    await dest.send(
-                        role.mention,
-                        allowed_mentions=discord.AllowedMentions(
-                            roles=True, users=False, everyone=False, replied_user=False
-                        ),
-                    )
                 await self.log_info(f"Created role {role.id} for event {event_id_str} in guild {guild.id}")
             except discord.Forbidden:
                 await dest.send(
@@ -3110,76 +3722,55 @@ class DiscoOps(commands.Cog):
                     "I don't have permission to create roles.\n\n"
                     "**Required Permission:** Manage Roles\n"
                     "**How to Fix:** Go to Server Settings → Roles → [My Role] and enable 'Manage Roles'",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    allowed_mentions=NO_MENTIONS,
                 )
                 return
 
         elif action_l == "sync":
             if event_id_str not in event_roles:
                 await dest.send(
-                    f"No role exists for event **{getattr(event, 'name', 'Event')}**. Use `create` first.",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    f"No role exists for event **{event_label}**. Use `create` first.",
+                    allowed_mentions=NO_MENTIONS,
                 )
                 return
             role = guild.get_role(event_roles[event_id_str])
             if not role:
                 await dest.send(
-                    f"Role no longer exists for event **{getattr(event, 'name', 'Event')}**",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    f"Role no longer exists for event **{event_label}**",
+                    allowed_mentions=NO_MENTIONS,
                 )
                 async with self.config.guild(guild).event_roles() as roles:
                     if event_id_str in roles:
                         del roles[event_id_str]
                 return
 
-            current_members = set(m.id for m in role.members)
-            interested_member_ids = set(m.id for m in interested_users)
+            # Diff by id, reading Member objects straight out of the maps.
+            current_by_id = {m.id: m for m in role.members}
+            interested_by_id = {m.id: m for m in interested_users}
+            add_members = [interested_by_id[i] for i in interested_by_id.keys() - current_by_id.keys()]
+            remove_members = [current_by_id[i] for i in current_by_id.keys() - interested_by_id.keys()]
 
-            to_add = interested_member_ids - current_members
-            to_remove = current_members - interested_member_ids
-
-            if len(to_add) + len(to_remove) > 10:
+            if len(add_members) + len(remove_members) > 10:
                 await dest.send(
-                    f"Syncing {role.mention}: {len(to_add)} to add, {len(to_remove)} to remove — this can take a while (Discord rate limits)…",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    f"Syncing {role.mention}: {len(add_members)} to add, {len(remove_members)} to remove — this can take a while (Discord rate limits)…",
+                    allowed_mentions=NO_MENTIONS,
                 )
-            added = removed = 0
             async with dest.typing():
-                for member_id in to_add:
-                    member = guild.get_member(member_id)
-                    if member:
-                        try:
-                            await member.add_roles(role, reason="Event role sync")
-                            added += 1
-                        except discord.Forbidden:
-                            pass
-                for member_id in to_remove:
-                    member = guild.get_member(member_id)
-                    if member:
-                        try:
-                            await member.remove_roles(role, reason="Event role sync")
-                            removed += 1
-                        except discord.Forbidden:
-                            pass
+                added, removed = await self._bulk_role_edit(
+                    role, add=add_members, remove=remove_members, reason="Event role sync"
+                )
 
             await dest.send(
                 f"Sync complete for {role.mention} — Added: {added} • Removed: {removed}",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=ROLE_PING_MENTIONS if ping else NO_MENTIONS,
             )
-            if ping:
-                await dest.send(
-                    role.mention,
-                    allowed_mentions=discord.AllowedMentions(
-                        roles=True, users=False, everyone=False, replied_user=False
-                    ),
-                )
             await self.log_info(f"Synced role {role.id} for event {event_id_str} in guild {guild.id}: +{added}/-{removed}")
 
         elif action_l == "delete":
             if event_id_str not in event_roles:
                 await dest.send(
-                    f"No role exists for event **{getattr(event, 'name', 'Event')}**",
-                    allowed_mentions=discord.AllowedMentions.none(),
+                    f"No role exists for event **{event_label}**",
+                    allowed_mentions=NO_MENTIONS,
                 )
                 return
             role = guild.get_role(event_roles[event_id_str])
@@ -3187,13 +3778,13 @@ class DiscoOps(commands.Cog):
                 try:
                     await role.delete(reason=f"Event role deleted by {author}")
                     await dest.send(
-                        f"Deleted role for event **{getattr(event, 'name', 'Event')}**",
-                        allowed_mentions=discord.AllowedMentions.none(),
+                        f"Deleted role for event **{event_label}**",
+                        allowed_mentions=NO_MENTIONS,
                     )
                 except discord.Forbidden:
                     await dest.send(
                         "I don't have permission to delete this role.",
-                        allowed_mentions=discord.AllowedMentions.none(),
+                        allowed_mentions=NO_MENTIONS,
                     )
                     return
             async with self.config.guild(guild).event_roles() as roles:
@@ -3201,6 +3792,38 @@ class DiscoOps(commands.Cog):
                     del roles[event_id_str]
             await self.log_info(f"Deleted role for event {event_id_str} in guild {guild.id}")
 
+    async def _bulk_role_edit(self, role: discord.Role, *, add=(), remove=(), reason: str) -> Tuple[int, int]:
+        """Give `role` to `add` and take it from `remove` in one concurrent pass.
+
+        Returns (added, removed). Each member needs exactly one atomic role
+        call; concurrency is capped cog-wide (see _role_sem) so large events,
+        or several syncs at once, don't trip rate limits.
+        """
+        sem = self._role_sem
+
+        async def _apply(member, is_add: bool) -> Tuple[int, int]:
+            async with sem:
+                try:
+                    if is_add:
+                        await member.add_roles(role, reason=reason)
+                        return 1, 0
+                    await member.remove_roles(role, reason=reason)
+                    return 0, 1
+                except discord.HTTPException:
+                    # Forbidden, or NotFound for a member who left mid-sync;
+                    # skip them rather than abort the whole batch.
+                    return 0, 0
+
+        results = await asyncio.gather(
+            *(_apply(m, True) for m in add),
+            *(_apply(m, False) for m in remove),
+            return_exceptions=True,
+        )
+        # Count successful edits only; one unexpected failure must not cost
+        # the caller its result message.
+        done = [r for r in results if isinstance(r, tuple)]
+        return sum(r[0] for r in done), sum(r[1] for r in done)
+
     # ========== Debug / Logs (Owner Only) ==========
 
     @discoops.command(name="logs")
@@ -3213,27 +3836,31 @@ class DiscoOps(commands.Cog):
             count = 10
         count = max(1, min(count, 200))  # allow up to 200 lines for convenience
 
+        await self._log_flush()  # include lines still waiting in the buffer
         content = await self._logs_tail(count)
         if not content:
             await ctx.send(
                 "No logs recorded yet.",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             return
 
         # Paginate long logs too
         header = "# DiscoOps Logs"
         raw_lines = content.split("\n")
-        chunks, cur = [], ""
+        chunks: List[str] = []
+        buf: List[str] = []
+        used = 0
         for ln in raw_lines:
-            nxt = (cur + ("\n" if cur else "") + ln)
-            if len(nxt) > MAX_MSG:
-                chunks.append(cur)
-                cur = ln
+            add = len(ln) + (1 if buf else 0)
+            if buf and used + add > MAX_MSG:
+                chunks.append("\n".join(buf))
+                buf, used = [ln], len(ln)
             else:
-                cur = nxt
-        if cur:
-            chunks.append(cur)
+                buf.append(ln)
+                used += add
+        if buf:
+            chunks.append("\n".join(buf))
         await self._send_paginated(ctx, chunks, header=header)
 
     @discoops.command(name="debug")
@@ -3242,7 +3869,7 @@ class DiscoOps(commands.Cog):
         """Show basic debug information (owner only)."""
         g = ctx.guild
         me = g.me
-        perms = g.me.guild_permissions
+        perms = me.guild_permissions
         msg = (
             "# DiscoOps Debug\n"
             f"**Guild**: {g.name} (ID {g.id})  •  **Members**: {g.member_count}\n\n"
@@ -3261,17 +3888,19 @@ class DiscoOps(commands.Cog):
     async def discoops_clearlogs(self, ctx):
         """Clear all stored logs (on disk)."""
         try:
-            if self._log_path.exists():
-                self._log_path.unlink()
+            async with self._log_lock:
+                # Drop unwritten lines and the append handle so nothing lands in the unlinked file.
+                self._log_buf.clear()
+                await asyncio.to_thread(self._clear_log_file)
             await ctx.send(
                 "Logs cleared.",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
             await self.log_info(f"Logs cleared by {ctx.author}")  # creates a fresh file with one entry
         except Exception as e:
             await ctx.send(
                 f"Couldn't clear logs: {e}",
-                allowed_mentions=discord.AllowedMentions.none(),
+                allowed_mentions=NO_MENTIONS,
             )
 
     @discoops.command(name="help")
@@ -3286,7 +3915,7 @@ class DiscoOps(commands.Cog):
             "## Events\n"
             "`[p]do event list` — List scheduled events (plain messages, paginated)\n"
             "`[p]do event \"Event Name\"` — Show one event (+ members)\n"
-            "`[p]do event role <create|sync|delete> \"Event Name\" [--ping]` — Manage event role\n"
+            "`[p]do event role <create|sync|delete> \"Event Name\" [--ping] [--force]` — Manage event role\n"
             "`[p]do event create` — Start the detailed event wizard\n\n"
             "## Activity\n"
             "`[p]do activity` — 7-day engagement overview (text + voice)\n"